@@ -1,32 +1,122 @@
 import time
-from typing import Set, List
+from typing import AbstractSet, Optional, Sequence
 
 import cv2
+import numpy as np
 
 from core.inference.inference_engine import InferenceEngine
 from interfaces import ICamera, IDetailUI, IController
 
+# Confianza mínima (además del umbral) para considerar "estable" una clase y saltar frames
+STABLE_CONF = 0.95
+
 
 class AppController(IController):
-    def __init__(self, camera: ICamera,engine: InferenceEngine,ui: IDetailUI,class_names: List[str],
-                 valid_classes: Set[str],no_object_class: str,threshold: float,confirm_frames: int,) -> None:
+    def __init__(self, camera: ICamera,engine: InferenceEngine,ui: IDetailUI,class_names: Sequence[str],
+                 valid_classes: AbstractSet[str],no_object_class: str,threshold: float,confirm_frames: int,
+                 valid_mask: Optional[np.ndarray] = None,skip_stride_max: int = 1,) -> None:
         self._camera = camera
         self._engine = engine
         self._ui = ui
         self._class_names = class_names
-        self._valid_classes = valid_classes
+        self._valid_classes = frozenset(valid_classes)
+        # Máscara por índice de clase: en cada frame se valida con valid_mask[idx]
+        # en vez de buscar el nombre en valid_classes
+        if valid_mask is None:
+            valid_mask = np.array([name in self._valid_classes for name in class_names], dtype=bool)
+        self._valid_mask = valid_mask
         self._no_object_class = no_object_class
+        self._no_object_idx = (
+            list(class_names).index(no_object_class) if no_object_class in class_names else -1
+        )
         self._threshold = threshold
         self._confirm_frames = confirm_frames
 
+        # Salto adaptativo: con una clase estable se infiere 1 de cada skip_stride_max frames
+        # (1 = inferir todos los frames)
+        self._skip_stride_max = max(1, int(skip_stride_max))
+        self._stable_conf = max(threshold, STABLE_CONF)
+
         self._paused = False
-        self._last_label = None
+        self._last_idx = None
         self._streak = 0
+        self._reset_stability()
 
     def _resume(self) -> None:
         self._paused = False
-        self._last_label = None
+        self._last_idx = None
         self._streak = 0
+        self._reset_stability()
+
+    def _reset_stability(self) -> None:
+        self._stable_idx = None
+        self._stable_count = 0
+        self._skip_remaining = 0
+
+    def _update_stability(self, idx: int, conf: float) -> None:
+        """
+        Cuenta los frames seguidos con la misma clase y confianza >= _stable_conf. Tras
+        confirm_frames frames así, los siguientes skip_stride_max - 1 frames no se infieren;
+        cualquier cambio de clase o bajada de confianza vuelve a inferir todos los frames.
+        """
+        if conf < self._stable_conf:
+            self._reset_stability()
+            return
+
+        if idx == self._stable_idx:
+            self._stable_count += 1
+        else:
+            self._stable_idx, self._stable_count = idx, 1
+
+        if self._stable_count >= self._confirm_frames:
+            self._skip_remaining = self._skip_stride_max - 1
+
+    @staticmethod
+    def _show_overlay(frame, label: str, conf: float, is_valid: bool) -> None:
+        overlay = frame.copy()
+        color = (0, 255, 0) if is_valid else (0, 200, 255)
+        cv2.putText(
+            overlay,
+            f"{label} ({conf:.2f})",
+            (10, 30),
+            cv2.FONT_HERSHEY_SIMPLEX,
+            1,
+            color,
+            2,
+            cv2.LINE_AA,
+        )
+        cv2.imshow("Teachable Machine - Cam", overlay)
+
+    def _handle_detection(self, root, idx: int, label: str, conf: float, is_valid: bool) -> None:
+        """Cuenta los frames válidos seguidos y, al confirmar, pausa y muestra la UI."""
+        if idx == self._no_object_idx:
+            self._last_idx, self._streak = None, 0
+            return
+
+        if not is_valid:
+            self._last_idx, self._streak = None, 0
+            return
+
+        if idx == self._last_idx:
+            self._streak += 1
+        else:
+            self._last_idx, self._streak = idx, 1
+
+        if self._streak >= self._confirm_frames:
+            self._paused = True
+            root.after(
+                0,
+                self._ui.show,
+                label,
+                conf,
+                self._resume,
+            )
+            while self._paused:
+                root.update()
+                if (cv2.waitKey(1) & 0xFF) == ord("q"):
+                    self._paused = False
+                    raise KeyboardInterrupt
+                time.sleep(0.01)
 
     def run(self, root) -> None:
         try:
@@ -37,6 +127,9 @@ class AppController(IController):
 
         print("Ventana de cámara activa. Pulsa 'q' para salir.")
 
+        valid_mask = self._valid_mask
+        class_names = self._class_names
+
         try:
             while True:
                 if not self._paused:
@@ -45,52 +138,17 @@ class AppController(IController):
                     except Exception:
                         break
 
-                    label, conf, _ = self._engine.predict(frame)
-
-                    overlay = frame.copy()
-                    color = (
-                        (0, 255, 0)
-                        if (label in self._valid_classes and conf >= self._threshold)
-                        else (0, 200, 255)
-                    )
-                    cv2.putText(
-                        overlay,
-                        f"{label} ({conf:.2f})",
-                        (10, 30),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        1,
-                        color,
-                        2,
-                        cv2.LINE_AA,
-                    )
-                    cv2.imshow("Teachable Machine - Cam", overlay)
-
-                    if label == self._no_object_class:
-                        self._last_label, self._streak = None, 0
+                    if self._skip_remaining > 0:
+                        # Clase estable: este frame solo se muestra, con el último resultado
+                        self._skip_remaining -= 1
+                        self._show_overlay(frame, label, conf, is_valid)
                     else:
-                        if label in self._valid_classes and conf >= self._threshold:
-                            if label == self._last_label:
-                                self._streak += 1
-                            else:
-                                self._last_label, self._streak = label, 1
-
-                            if self._streak >= self._confirm_frames:
-                                self._paused = True
-                                root.after(
-                                    0,
-                                    self._ui.show,
-                                    label,
-                                    conf,
-                                    self._resume,
-                                )
-                                while self._paused:
-                                    root.update()
-                                    if (cv2.waitKey(1) & 0xFF) == ord("q"):
-                                        self._paused = False
-                                        raise KeyboardInterrupt
-                                    time.sleep(0.01)
-                        else:
-                            self._last_label, self._streak = None, 0
+                        idx, conf, _ = self._engine.predict_index(frame)
+                        label = class_names[idx]
+                        is_valid = bool(valid_mask[idx]) and conf >= self._threshold
+                        self._show_overlay(frame, label, conf, is_valid)
+                        self._update_stability(idx, conf)
+                        self._handle_detection(root, idx, label, conf, is_valid)
 
                 if cv2.waitKey(1) & 0xFF == ord("q"):
                     break
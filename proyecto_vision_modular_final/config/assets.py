@@ -8,29 +8,55 @@ Ahora se usa:
   (imágenes y URLs de datasheets), recibiendo el directorio de imágenes por parámetro.
 
 No hay instancias globales; quien quiera usarlo debe instanciar el registro.
+
+Las imágenes pueden tener una miniatura ya redimensionada en img_dir/_thumbs/<nombre>_200.png
+(get_thumbnail_path). get_image_path siempre devuelve la ruta original, que identifica a la
+imagen; la miniatura es solo el archivo que conviene leer si ya existe.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional
+
+# Lado máximo (px) de las miniaturas y carpeta (dentro de img_dir) donde se guardan
+THUMB_SIZE = 200
+THUMB_DIR_NAME = "_thumbs"
 
 
 class BaseAssetRegistry:
     """Clase base para manejar recursos de componentes (imágenes, datasheets, nombres Excel)."""
 
-    def __init__(self, img_dir: str) -> None:
+    def __init__(
+        self,
+        img_dir: str,
+        assets: Optional[Mapping[str, Dict[str, str]]] = None,
+        excel_name_map: Optional[Mapping[str, str]] = None,
+    ) -> None:
         self._img_dir = Path(img_dir)
-        self._assets: Dict[str, Dict[str, str]] = {}
-        self._excel_name_map: Dict[str, str] = {}
+        self._assets: Dict[str, Dict[str, str]] = dict(assets or {})
+        self._excel_name_map: Mapping[str, str] = MappingProxyType(dict(excel_name_map or {}))
+
+        # Vistas de solo lectura creadas una vez: list_* no copia nada en cada llamada
+        self._assets_view: Mapping[str, Dict[str, str]] = MappingProxyType(self._assets)
 
     def get_asset(self, model_name: str) -> Optional[Dict[str, str]]:
         """Devuelve el diccionario de asset para una clase del modelo, o None si no existe."""
         return self._assets.get(model_name)
 
     def get_image_path(self, model_name: str) -> Optional[str]:
-        """Devuelve la ruta de la imagen para una clase del modelo."""
+        """Devuelve la ruta de la imagen original para una clase del modelo."""
         asset = self.get_asset(model_name)
         return asset.get("img") if asset else None
 
+    def get_thumbnail_path(self, model_name: str) -> Optional[str]:
+        """Devuelve dónde va (o está) la miniatura de la imagen de una clase, exista o no."""
+        asset = self.get_asset(model_name)
+        img = asset.get("img") if asset else None
+        if not img:
+            return None
+        return str(self._img_dir / THUMB_DIR_NAME / f"{Path(img).stem}_{THUMB_SIZE}.png")
+
     def get_datasheet_url(self, model_name: str) -> Optional[str]:
         """Devuelve la URL del datasheet para una clase del modelo."""
         asset = self.get_asset(model_name)
@@ -40,13 +66,18 @@ class BaseAssetRegistry:
         """Traduce el nombre del modelo al nombre usado en el Excel."""
         return self._excel_name_map.get(model_name)
 
-    def list_model_names(self) -> Dict[str, Dict[str, str]]:
-        """Devuelve una copia del diccionario completo de assets."""
-        return dict(self._assets)
+    def map_many(self, model_names: Iterable[str]) -> List[Optional[str]]:
+        """Traduce varios nombres del modelo a la vez (una búsqueda por nombre)."""
+        get = self._excel_name_map.get
+        return [get(name) for name in model_names]
 
-    def list_excel_mappings(self) -> Dict[str, str]:
-        """Devuelve una copia del diccionario de mapeos Excel."""
-        return dict(self._excel_name_map)
+    def list_model_names(self) -> Mapping[str, Dict[str, str]]:
+        """Devuelve una vista de solo lectura del diccionario completo de assets."""
+        return self._assets_view
+
+    def list_excel_mappings(self) -> Mapping[str, str]:
+        """Devuelve una vista de solo lectura del diccionario de mapeos Excel."""
+        return self._excel_name_map
 
 
 class DefaultAssetRegistry(BaseAssetRegistry):
@@ -56,31 +87,41 @@ class DefaultAssetRegistry(BaseAssetRegistry):
     Hereda toda la lógica de acceso de BaseAssetRegistry y solo define los datos.
     """
 
-    def __init__(self, img_dir: str) -> None:
-        super().__init__(img_dir=img_dir)
+    # (nombre del modelo, archivo de imagen dentro de img_dir, URL del datasheet)
+    _ASSET_SPEC = (
+        (
+            "Modulo Rele 2",
+            "word-image-31183-1.webp",
+            "https://mm.digikey.com/Volume0/opasdata/d220001/medias/docus/5773/TS0010D%20DATASHEET.pdf",
+        ),
+        (
+            "7404",
+            "74LS04-pinout.jpg",
+            "https://www.ti.com/lit/ds/symlink/sn7404.pdf",
+        ),
+        (
+            "Diodo Zener",
+            "Zener-diode-new.png",
+            "https://www.onsemi.com/download/data-sheet/pdf/1n4736at-d.pdf",
+        ),
+        (
+            "7805",
+            "7805.jpg",
+            "https://datasheet.octopart.com/L7805CV-STMicroelectronics-datasheet-7264666.pdf",
+        ),
+    )
 
-        self._assets = {
-            "Modulo Rele 2": {
-                "img": str(self._img_dir / "word-image-31183-1.webp"),
-                "url": "https://mm.digikey.com/Volume0/opasdata/d220001/medias/docus/5773/TS0010D%20DATASHEET.pdf",
-            },
-            "7404": {
-                "img": str(self._img_dir / "74LS04-pinout.jpg"),
-                "url": "https://www.ti.com/lit/ds/symlink/sn7404.pdf",
-            },
-            "Diodo Zener": {
-                "img": str(self._img_dir / "Zener-diode-new.png"),
-                "url": "https://www.onsemi.com/download/data-sheet/pdf/1n4736at-d.pdf",
+    def __init__(self, img_dir: str) -> None:
+        super().__init__(
+            img_dir=img_dir,
+            assets={
+                name: {"img": os.path.join(img_dir, filename), "url": url}
+                for name, filename, url in self._ASSET_SPEC
             },
-            "7805": {
-                "img": str(self._img_dir / "7805.jpg"),
-                "url": "https://datasheet.octopart.com/L7805CV-STMicroelectronics-datasheet-7264666.pdf",
+            excel_name_map={
+                "Modulo Rele 2": "Modulos Rele de Doble canal",
+                "Diodo Zener":   "Diodo Zener",
+                "7805":          "7805",
+                "7404":          "7404",
             },
-        }
-
-        self._excel_name_map = {
-            "Modulo Rele 2": "Modulos Rele de Doble canal",
-            "Diodo Zener":   "Diodo Zener",
-            "7805":          "7805",
-            "7404":          "7404",
-        }
+        )
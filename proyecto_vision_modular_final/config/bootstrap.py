@@ -8,27 +8,71 @@ Se usan clases:
 """
 
 import os
+import stat
+from typing import Dict, List, Optional, Tuple
+
 from .settings import AppSettings
 
+# Caché de stat() dentro de una validación: ruta -> resultado (None si falló)
+_StatCache = Dict[str, Optional[os.stat_result]]
+_NOT_CACHED = object()
+
 
 class BaseSettingsValidator:
     """Validador base con métodos reutilizables para verificar rutas y archivos."""
 
     @staticmethod
-    def _ensure_directory(path: str, label: str) -> None:
-        if not os.path.isdir(path):
-            raise FileNotFoundError(f"{label} inválido: {path}")
+    def _stat(path: str) -> Optional[os.stat_result]:
+        """
+        Hace un único stat() sobre la ruta (EAFP): devuelve None si no existe o
+        no es accesible, en lugar de preguntar primero y leer después.
+        """
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
 
-    @staticmethod
-    def _ensure_directory_from_file(path: str, label: str) -> None:
-        directory = os.path.dirname(path)
-        if not os.path.isdir(directory):
-            raise FileNotFoundError(f"{label} inválido: {path}")
+    @classmethod
+    def _cached_stat(cls, path: str, stat_cache: Optional[_StatCache]) -> Optional[os.stat_result]:
+        """stat() memoizado en `stat_cache`, incluyendo las rutas que ya fallaron."""
+        if stat_cache is None:
+            return cls._stat(path)
+        st = stat_cache.get(path, _NOT_CACHED)
+        if st is _NOT_CACHED:
+            st = cls._stat(path)
+            stat_cache[path] = st
+        return st
 
-    @staticmethod
-    def _ensure_file(path: str, label: str) -> None:
-        if not os.path.isfile(path):
-            raise FileNotFoundError(f"{label} inválido: {path}")
+    @classmethod
+    def _check_path(
+        cls,
+        path: str,
+        kind: str,
+        label: str,
+        shown_path: Optional[str] = None,
+        stat_cache: Optional[_StatCache] = None,
+    ) -> None:
+        """
+        Verifica con un solo stat() que `path` exista y sea del tipo esperado
+        ("dir" o "file"). En el mensaje de error se muestra `shown_path` si se indica.
+        Si se pasa `stat_cache`, una misma ruta no se consulta dos veces.
+        """
+        st = cls._cached_stat(path, stat_cache)
+        is_kind = stat.S_ISDIR if kind == "dir" else stat.S_ISREG
+        if st is None or not is_kind(st.st_mode):
+            raise FileNotFoundError(f"{label} inválido: {shown_path or path}")
+
+    @classmethod
+    def _ensure_directory(cls, path: str, label: str) -> None:
+        cls._check_path(path, "dir", label)
+
+    @classmethod
+    def _ensure_directory_from_file(cls, path: str, label: str) -> None:
+        cls._check_path(os.path.dirname(path), "dir", label, path)
+
+    @classmethod
+    def _ensure_file(cls, path: str, label: str) -> None:
+        cls._check_path(path, "file", label)
 
 
 class AppSettingsValidator(BaseSettingsValidator):
@@ -37,24 +81,23 @@ class AppSettingsValidator(BaseSettingsValidator):
     @classmethod
     def validate(cls, settings: AppSettings) -> None:
         """Valida rutas y parámetros críticos antes de iniciar la app."""
+        cls._validate_required_values(settings)
 
-        # Modelo local
-        cls._ensure_directory_from_file(settings.SAVEDMODEL_DIR, "SAVEDMODEL_DIR")
-
-        # Imágenes
-        cls._ensure_directory(settings.IMG_DIR, "IMG_DIR")
-
-        # Excel
-        if settings.INVENTORY_BACKEND in ("excel", "multi"):
-            cls._ensure_directory_from_file(settings.EXCEL_PATH, "EXCEL_PATH")
+        # Todas las rutas se revisan en una sola pasada; las carpetas compartidas
+        # (p. ej. el padre de SAVEDMODEL_DIR y de EXCEL_PATH) se consultan una vez
+        stat_cache: _StatCache = {}
+        for path, kind, label, shown_path in cls._collect_path_checks(settings):
+            cls._check_path(path, kind, label, shown_path, stat_cache)
 
+    @staticmethod
+    def _validate_required_values(settings: AppSettings) -> None:
+        """Valida los parámetros obligatorios según los backends elegidos."""
         # Google Sheets
         if settings.INVENTORY_BACKEND in ("google_sheet", "multi"):
             if not settings.GSHEET_ID:
                 raise ValueError(
                     "GSHEET_ID es obligatorio para INVENTORY_BACKEND=google_sheet o multi"
                 )
-            cls._ensure_file(settings.GSHEET_CREDENTIALS, "GSHEET_CREDENTIALS")
 
         # Modelo Google Vision (si se usa)
         if settings.MODEL_BACKEND == "google":
@@ -62,4 +105,42 @@ class AppSettingsValidator(BaseSettingsValidator):
                 raise ValueError(
                     "GCLOUD_CREDENTIALS es obligatorio para MODEL_BACKEND=google"
                 )
-            cls._ensure_file(settings.GCLOUD_CREDENTIALS, "GCLOUD_CREDENTIALS")
+
+    @staticmethod
+    def _collect_path_checks(settings: AppSettings) -> List[Tuple[str, str, str, str]]:
+        """
+        Reúne las rutas a verificar como tuplas
+        (ruta a revisar, tipo esperado, etiqueta, ruta a mostrar en el error).
+        """
+        checks: List[Tuple[str, str, str, str]] = [
+            # Modelo local
+            (os.path.dirname(settings.SAVEDMODEL_DIR), "dir", "SAVEDMODEL_DIR", settings.SAVEDMODEL_DIR),
+            # Imágenes
+            (settings.IMG_DIR, "dir", "IMG_DIR", settings.IMG_DIR),
+        ]
+
+        # Excel
+        if settings.INVENTORY_BACKEND in ("excel", "multi"):
+            checks.append(
+                (os.path.dirname(settings.EXCEL_PATH), "dir", "EXCEL_PATH", settings.EXCEL_PATH)
+            )
+
+        # Google Sheets
+        if settings.INVENTORY_BACKEND in ("google_sheet", "multi"):
+            checks.append(
+                (settings.GSHEET_CREDENTIALS, "file", "GSHEET_CREDENTIALS", settings.GSHEET_CREDENTIALS)
+            )
+
+        # Modelo TFLite (generado con infrastructure/model/tflite_converter.py)
+        if settings.MODEL_BACKEND == "tflite":
+            checks.append(
+                (settings.TFLITE_PATH, "file", "TFLITE_PATH", settings.TFLITE_PATH)
+            )
+
+        # Modelo Google Vision (si se usa)
+        if settings.MODEL_BACKEND == "google":
+            checks.append(
+                (settings.GCLOUD_CREDENTIALS, "file", "GCLOUD_CREDENTIALS", settings.GCLOUD_CREDENTIALS)
+            )
+
+        return checks
@@ -8,8 +8,16 @@ Se usan dos clases:
 """
 
 import os
+import re
 from typing import Dict
 
+# Una línea KEY=VALUE: ignora líneas vacías, comentarios (#...) y comentarios al final.
+# Acepta finales de línea \n y \r\n (el archivo se lee en binario, sin traducir).
+_ENV_LINE_RE = re.compile(
+    r"^[ \t]*([^#=\s][^=\r\n]*?)[ \t]*=[ \t]*([^#\r\n]*?)[ \t]*(?:#[^\r\n]*)?\r?$",
+    re.MULTILINE,
+)
+
 
 class BaseFileLoader:
     """Clase base para loaders de archivos."""
@@ -24,6 +32,29 @@ class BaseFileLoader:
                 f"No se encontró el archivo requerido en {os.path.abspath(self._path)}"
             )
 
+    def _read_bytes(self) -> bytes:
+        """
+        Lee el archivo completo con os.open/os.read, sin crear la pila de io
+        (BufferedReader + TextIOWrapper). Lanza el mismo error que _ensure_exists
+        si el archivo no existe.
+        """
+        try:
+            fd = os.open(self._path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except FileNotFoundError:
+            self._ensure_exists()
+            raise
+
+        try:
+            size = os.fstat(fd).st_size
+            data = b""
+            while True:
+                chunk = os.read(fd, max(size - len(data), 4096))
+                if not chunk:
+                    return data
+                data += chunk
+        finally:
+            os.close(fd)
+
     @property
     def path(self) -> str:
         """Ruta del archivo que se está manejando."""
@@ -35,17 +66,6 @@ class EnvLoader(BaseFileLoader):
 
     def load(self) -> Dict[str, str]:
         """Carga archivo .env KEY=VALUE sin dependencias externas."""
-        self._ensure_exists()
-        env: Dict[str, str] = {}
-
-        with open(self._path, "r", encoding="utf-8") as f:
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                # Soporta comentarios al final de la línea
-                value = value.split("#", 1)[0].strip()
-                env[key.strip()] = value
-
-        return env
+        text = self._read_bytes().decode("utf-8")
+        # Una sola pasada de la regex compilada sobre todo el archivo
+        return dict(_ENV_LINE_RE.findall(text))
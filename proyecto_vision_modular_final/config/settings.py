@@ -6,13 +6,22 @@ Módulo de configuración de la aplicación.
 - Expone una API orientada a objetos mediante SettingsManager (sin variables ni funciones globales ejecutadas al importar).
 """
 
+import functools
+import os
+import threading
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 
 from .env_loader import EnvLoader
 
+# Variantes TFLite que genera infrastructure/model/tflite_converter.py dentro de SAVEDMODEL_DIR
+TFLITE_VARIANTS: Dict[str, str] = {
+    "float16": "model_float16.tflite",
+    "int8": "model_int8.tflite",
+}
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     # Rutas y archivos
     SAVEDMODEL_DIR: str
@@ -30,7 +39,7 @@ class AppSettings:
     NO_OBJECT_CLASS: str
 
     # Backend de modelo
-    MODEL_BACKEND: str           # "local" o "google"
+    MODEL_BACKEND: str           # "auto", "local", "tflite" o "google"
     GCLOUD_CREDENTIALS: str      # ruta al JSON de credenciales de Vision (si se usa)
 
     # Backend de inventario
@@ -42,6 +51,15 @@ class AppSettings:
     # Clases que cuentan como inventario (por nombre)
     INVENTORY_CLASSES: List[str]
 
+    # Modelo TFLite (solo si MODEL_BACKEND=tflite)
+    TFLITE_VARIANT: str = "float16"  # "float16" o "int8"
+    TFLITE_PATH: str = ""            # por defecto SAVEDMODEL_DIR/model_<variante>.tflite
+    TFLITE_THREADS: int = 0          # 0 = mitad de los núcleos de la CPU
+    USE_CORAL: bool = False          # usar el delegado de la Coral Edge TPU
+
+    # Con una clase estable (conf >= 0.95) se infiere 1 de cada SKIP_STRIDE_MAX frames (1 = todos)
+    SKIP_STRIDE_MAX: int = 3
+
 
 class BaseSettingsBuilder:
     """
@@ -78,12 +96,25 @@ class BaseSettingsBuilder:
         except Exception:
             raise ValueError(f"No se pudo convertir el valor de '{name}' en .env")
 
+    @staticmethod
+    def _parse_bool(raw: str) -> bool:
+        """
+        Convierte textos como 1/0, true/false, si/no u on/off en bool.
+        USE_CORAL=true
+        """
+        value = raw.strip().lower()
+        if value in ("1", "true", "si", "sí", "yes", "on"):
+            return True
+        if value in ("0", "false", "no", "off", ""):
+            return False
+        raise ValueError(f"Valor booleano inválido: {raw!r}")
+
     def _parse_list(self, raw: str) -> List[str]:
         """
         Convierte una cadena separada por comas en una lista de strings limpios.
         INVENTORY_CLASSES=Item1, Item2, Item3
         """
-        return [s.strip() for s in raw.split(",") if s.strip()]
+        return list(filter(None, map(str.strip, raw.split(","))))
 
 
 class EnvSettingsBuilder(BaseSettingsBuilder):
@@ -94,9 +125,17 @@ class EnvSettingsBuilder(BaseSettingsBuilder):
 
     def build(self) -> AppSettings:
         """Construye la configuración de la aplicación a partir del contenido del .env."""
+        savedmodel_dir = self._get("SAVEDMODEL_DIR", str)
+        tflite_variant = self._env.get("TFLITE_VARIANT", "float16")
+        if tflite_variant not in TFLITE_VARIANTS:
+            raise ValueError(
+                f"TFLITE_VARIANT inválido: {tflite_variant!r}. "
+                f"Usa {' o '.join(map(repr, TFLITE_VARIANTS))}."
+            )
+
         return AppSettings(
             # Rutas
-            SAVEDMODEL_DIR=self._get("SAVEDMODEL_DIR", str),
+            SAVEDMODEL_DIR=savedmodel_dir,
             EXCEL_PATH=self._get("EXCEL_PATH", str),
             IMG_DIR=self._get("IMG_DIR", str),
 
@@ -124,6 +163,15 @@ class EnvSettingsBuilder(BaseSettingsBuilder):
             INVENTORY_CLASSES=self._parse_list(
                 self._env.get("INVENTORY_CLASSES", "")
             ),
+
+            # Modelo TFLite
+            TFLITE_VARIANT=tflite_variant,
+            TFLITE_PATH=self._env.get("TFLITE_PATH")
+            or os.path.join(savedmodel_dir, TFLITE_VARIANTS[tflite_variant]),
+            TFLITE_THREADS=self._get_opt("TFLITE_THREADS", 0, int),
+            USE_CORAL=self._get_opt("USE_CORAL", False, self._parse_bool),
+
+            SKIP_STRIDE_MAX=self._get_opt("SKIP_STRIDE_MAX", 3, int),
         )
 
 
@@ -133,21 +181,31 @@ class SettingsManager:
 
     - No ejecuta nada automáticamente al importar el módulo.
     - Mantiene una instancia interna de AppSettings encapsulada en un atributo de clase.
+    - Cada .env se lee y se construye una sola vez por proceso (caché por ruta);
+      el acceso está protegido con un lock para poder usarse desde varios hilos.
     """
 
     _settings: Optional[AppSettings] = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _load(env_path: str) -> AppSettings:
+        """Lee el .env y construye AppSettings; el resultado queda en caché por ruta."""
+        raw_env = EnvLoader(env_path).load()
+        return EnvSettingsBuilder(raw_env).build()
 
     @classmethod
     def load_from_env(cls, env_path: str = ".env") -> AppSettings:
         """
         Carga el archivo .env, construye un AppSettings y lo almacena internamente.
 
-        Debe llamarse explícitamente (por ejemplo, al inicio de main.py).
+        Debe llamarse explícitamente (por ejemplo, al inicio de main.py). Llamadas
+        repetidas con la misma ruta reutilizan la configuración ya construida.
         """
-        raw_env = EnvLoader(env_path).load()
-        builder = EnvSettingsBuilder(raw_env)
-        settings = builder.build()
-        cls._settings = settings
+        with cls._lock:
+            settings = cls._load(env_path)
+            cls._settings = settings
         return settings
 
     @classmethod
@@ -155,11 +213,9 @@ class SettingsManager:
         """
         Devuelve la configuración ya cargada.
 
-        Lanza error si aún no se ha llamado a load_from_env.
+        Si aún no se ha llamado a load_from_env, carga el ".env" por defecto.
         """
-        if cls._settings is None:
-            raise RuntimeError(
-                "AppSettings no ha sido cargado. Llama primero a "
-                "SettingsManager.load_from_env()."
-            )
-        return cls._settings
+        settings = cls._settings
+        if settings is None:
+            settings = cls.load_from_env()
+        return settings
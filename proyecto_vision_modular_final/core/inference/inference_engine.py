@@ -1,60 +1,88 @@
 """
 load_labels carga la lista de clases desde el modelo para saber qué nombre corresponde a cada índice.
+Las etiquetas leídas se guardan en memoria por carpeta, así volver a crear el motor en el mismo
+proceso no vuelve a leer el archivo.
     1.-InferenceEngine es el motor de predicción: preprocesa la imagen, ejecuta el modelo, convierte 
     los logits en probabilidades y devuelve la etiqueta final con su confianza.
     
 Si algo falla en la inferencia, el sistema corta y reporta el error para evitar decisiones incorrectas.
 """
+import functools
 import os
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
 import numpy as np
-import tensorflow as tf
 
 from interfaces import IPreprocessor, IModel
 
 
+@functools.lru_cache(maxsize=4)
+def _read_labels(model_dir: str) -> Tuple[str, ...]:
+    """Lee las etiquetas de model_dir una sola vez por proceso (tupla inmutable en caché)."""
+    candidates = [
+        os.path.join(model_dir, "assets", "labels.txt"),
+        os.path.join(model_dir, "labels.txt"),
+    ]
+    for p in candidates:
+        if os.path.exists(p):
+            try:
+                with open(p, "r", encoding="utf-8") as f:
+                    labels = tuple(ln.strip() for ln in f if ln.strip())
+                if labels:
+                    return labels
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al leer labels desde {p}: {e}")
+                raise
+    print("[ERROR] No se encontraron labels.txt válidos, usando etiquetas por defecto.")
+    return ("Modulo Rele 2", "7404", "Diodo Zener", "7805", "No hay nada")
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    """Softmax estable de un vector de logits, en float32 y con NumPy."""
+    exp = np.exp(logits - logits.max())
+    exp /= exp.sum()
+    return exp
+
+
 class InferenceEngine:
     def __init__(self,preprocessor: IPreprocessor,model: IModel,
-        class_names: List[str],) -> None:
+        class_names: Sequence[str],) -> None:
         self._preprocessor = preprocessor
         self._model = model
-        self._class_names = class_names
+        # Tupla: inmutable y de indexación directa en cada frame
+        self._class_names = tuple(class_names)
     
+    @staticmethod
     def load_labels(model_dir: str) -> List[str]:
         """Carga labels desde assets/labels.txt o labels.txt.
 
-        Si falla, devuelve un conjunto por defecto.
+        Si falla, devuelve un conjunto por defecto. La lectura se hace una vez por
+        carpeta; cada llamada devuelve una lista nueva que se puede modificar sin
+        afectar a la caché.
         """
-        candidates = [
-            os.path.join(model_dir, "assets", "labels.txt"),
-            os.path.join(model_dir, "labels.txt"),
-        ]
-        for p in candidates:
-            if os.path.exists(p):
-                try:
-                    with open(p, "r", encoding="utf-8") as f:
-                        labels = [ln.strip() for ln in f if ln.strip()]
-                    if labels:
-                        return labels
-                except Exception as e:
-                    print(f"[ERROR] Ha ocurrido un error al leer labels desde {p}: {e}")
-                    raise
-        print("[ERROR] No se encontraron labels.txt válidos, usando etiquetas por defecto.")
-        return ["Modulo Rele 2", "7404", "Diodo Zener", "7805", "No hay nada"]
+        return list(_read_labels(os.path.abspath(model_dir)))
 
     def predict(self, frame) -> Tuple[str, float, np.ndarray]:
         """Devuelve (label, confianza, vector_de_probabilidades)."""
+        idx, conf, probs = self.predict_index(frame)
+        return self._class_names[idx], conf, probs
+
+    def predict_index(self, frame) -> Tuple[int, float, np.ndarray]:
+        """Igual que predict, pero devuelve el índice de la clase en lugar del nombre."""
         try:
             img = self._preprocessor.preprocess(frame)
-            outputs = self._model.predict(tf.constant(img))
+            # El modelo recibe el arreglo del preprocesador tal cual; cada backend lo
+            # convierte a su formato (tf.Tensor, tensor TFLite, JPEG...)
+            outputs = self._model.predict(img)
             first_key = list(outputs.keys())[0]
             logits = outputs[first_key]
-            probs = tf.nn.softmax(logits, axis=-1).numpy()[0]
+            # float32 contiguo (también si llega un tf.Tensor o logits enteros) para que
+            # softmax y argmax se vectoricen; se toma la fila del único frame del lote
+            logits = np.ascontiguousarray(logits, dtype=np.float32).reshape(-1)
+            probs = _softmax(logits)
             idx = int(np.argmax(probs))
-            label = self._class_names[idx]
             conf = float(probs[idx])
-            return label, conf, probs
+            return idx, conf, probs
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error durante la inferencia: {e}")
             raise
@@ -1,10 +1,14 @@
 '''
 TMPreprocessor es el módulo que toma la imagen cruda de la cámara y la convierte en un tensor listo
 para la IA.
-    1.- Primero cambia de BGR a RGB, luego escala la imagen al tamaño adecuado, la normaliza en el
-      rango 0–1 y finalmente agrega la dimensión batch.
+    1.- Primero escala la imagen al tamaño adecuado, cambia de BGR a RGB, la normaliza en el
+      rango 0–1 y la deja en un tensor con la dimensión batch.
+    2.- Los buffers (imagen escalada, imagen RGB y tensor final) se reservan una sola vez en el
+      constructor y cada frame se escribe encima, sin crear arreglos nuevos.
 
 El resultado es un tensor perfectamente compatible con el modelo TensorFlow para ejecutar la inferencia.
+IMPORTANTE: preprocess devuelve siempre el MISMO arreglo; hay que usarlo (o copiarlo) antes de
+procesar el siguiente frame.
 '''
 import cv2
 import numpy as np
@@ -14,9 +18,22 @@ from interfaces import IPreprocessor
 class TMPreprocessor(IPreprocessor):
     def __init__(self, input_size: int) -> None:
         self._size = input_size
+        self._resized = np.empty((input_size, input_size, 3), dtype=np.uint8)
+        self._rgb = np.empty((input_size, input_size, 3), dtype=np.uint8)
+        self._buf = np.empty((1, input_size, input_size, 3), dtype=np.float32)
 
     def preprocess(self, frame: np.ndarray) -> np.ndarray:
-        img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        img = cv2.resize(img, (self._size, self._size), interpolation=cv2.INTER_LINEAR)
-        img = img.astype(np.float32) / 255.0
-        return np.expand_dims(img, axis=0)
+        if frame.dtype != np.uint8 or frame.ndim != 3 or frame.shape[2] != 3:
+            # Formato inesperado: camino original, que crea arreglos nuevos
+            img = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            img = cv2.resize(img, (self._size, self._size), interpolation=cv2.INTER_LINEAR)
+            img = img.astype(np.float32) / 255.0
+            return np.expand_dims(img, axis=0)
+
+        # Escalar antes de convertir el color: mismo resultado, menos píxeles que convertir
+        cv2.resize(
+            frame, (self._size, self._size), dst=self._resized, interpolation=cv2.INTER_LINEAR
+        )
+        cv2.cvtColor(self._resized, cv2.COLOR_BGR2RGB, dst=self._rgb)
+        np.divide(self._rgb, np.float32(255.0), out=self._buf[0])
+        return self._buf
@@ -1,11 +1,16 @@
 """
 OpenCVCamera es la capa de acceso a la cámara.
-    1.-Con __init__ configuro qué cámara y qué resolución usar.
-    2.-Con open() la inicializo validando que realmente se abra.
+    1.-Con __init__ configuro qué cámara y qué resolución usar (y, opcionalmente, el formato
+      de compresión, el tamaño del buffer y los FPS).
+    2.-Con open() la inicializo validando que realmente se abra. Por defecto pide MJPG (la
+      cámara comprime y el USB transporta mucho menos que YUYV) y un buffer de 1 frame, para
+      que read() devuelva siempre el frame más reciente y no uno atrasado.
     3.-Con read() capturo cada frame y manejo los errores de lectura.
     4.-Con release() libero el dispositivo al final para no dejar la cámara tomada por el programa.
 """
 
+from typing import Optional
+
 import cv2
 import numpy as np
 
@@ -13,22 +18,47 @@ from interfaces import ICamera
 
 
 class OpenCVCamera(ICamera):
-    def __init__(self, index: int, width: int, height: int) -> None:
+    def __init__(
+        self,
+        index: int,
+        width: int,
+        height: int,
+        fourcc: Optional[str] = "MJPG",
+        buffer_size: Optional[int] = 1,
+        fps: Optional[int] = 30,
+    ) -> None:
         self._index = index
         self._width = width
         self._height = height
+        # None = dejar el valor que traiga la cámara
+        self._fourcc = fourcc
+        self._buffer_size = buffer_size
+        self._fps = fps
         self._cap = None  # se inicializa en open()
 
     def open(self) -> None:
         """
-        Abre la cámara física y configura la resolución.
+        Abre la cámara física y configura formato, resolución, buffer y FPS.
+        Si la cámara no acepta alguno de estos valores, OpenCV lo ignora y sigue.
+        Si ya está abierta no hace nada (Application y AppController llaman ambos a open()).
 
         Lanza RuntimeError si no se puede abrir.
         """
+        if self._cap is not None and self._cap.isOpened():
+            return
+
         try:
             self._cap = cv2.VideoCapture(self._index, cv2.CAP_DSHOW)
+            # El formato va antes de la resolución: algunos drivers solo ofrecen
+            # resoluciones altas en MJPG
+            if self._fourcc:
+                self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*self._fourcc))
             self._cap.set(cv2.CAP_PROP_FRAME_WIDTH, self._width)
             self._cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self._height)
+            if self._buffer_size is not None:
+                self._cap.set(cv2.CAP_PROP_BUFFERSIZE, self._buffer_size)
+            if self._fps is not None:
+                self._cap.set(cv2.CAP_PROP_FPS, self._fps)
 
             if not self._cap.isOpened():
                 print("[ERROR] Ha ocurrido un error con la cámara: no se pudo abrir.")
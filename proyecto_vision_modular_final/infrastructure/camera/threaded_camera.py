@@ -0,0 +1,132 @@
+"""
+ThreadedCamera envuelve cualquier ICamera y lee los frames en un hilo productor aparte.
+    1.-Con open() abre la cámara envuelta y arranca el hilo, que llama a read() sin parar y deja
+      el frame en una cola de tamaño 1: si el anterior no se consumió, lo descarta (drop-oldest).
+      Así la inferencia siempre trabaja sobre el frame más reciente y las esperas de la cámara
+      se solapan con el tiempo de inferencia en vez de sumarse.
+    2.-Con read() el consumidor (AppController) toma el último frame. Si el hilo productor falló,
+      el error se relanza aquí, en el hilo que llama, como haría la cámara original.
+    3.-Con release() detiene el hilo y libera la cámara envuelta. Si el hilo sigue bloqueado
+      dentro de read() de la cámara, no se libera desde afuera (VideoCapture no admite release
+      y read a la vez): lo hace el propio hilo productor al salir del bucle.
+"""
+
+import queue
+import threading
+from typing import Optional
+
+import numpy as np
+
+from interfaces import ICamera
+
+
+class ThreadedCamera(ICamera):
+    def __init__(self, camera: ICamera, read_timeout: float = 2.0) -> None:
+        self._camera = camera
+        # Segundos que read() espera un frame antes de dar la cámara por caída
+        self._read_timeout = read_timeout
+
+        self._frames: "queue.Queue[Optional[np.ndarray]]" = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[Exception] = None
+
+        # Protegen el traspaso de release() al hilo productor cuando este no terminó a tiempo
+        self._lock = threading.Lock()
+        self._producer_running = False
+        self._release_on_exit = False
+
+    def open(self) -> None:
+        """
+        Abre la cámara envuelta y arranca el hilo productor.
+        Si ya está corriendo no hace nada (Application y AppController llaman ambos a open()).
+        """
+        if self._thread is not None:
+            if self._thread.is_alive() and not self._stop.is_set():
+                return
+            # Un productor anterior puede seguir dentro de read(): se espera a que salga
+            # (y libere la cámara) antes de volver a abrirla
+            self._thread.join()
+
+        self._camera.open()
+        self._stop.clear()
+        self._error = None
+        self._producer_running = True
+        self._thread = threading.Thread(
+            target=self._produce, name="camera-reader", daemon=True
+        )
+        self._thread.start()
+
+    def _produce(self) -> None:
+        try:
+            while not self._stop.is_set():
+                try:
+                    frame = self._camera.read()
+                except Exception as e:
+                    # None despierta al consumidor, que relanza el error en su read()
+                    self._error = e
+                    self._put_latest(None)
+                    return
+                self._put_latest(frame)
+        finally:
+            with self._lock:
+                self._producer_running = False
+                release = self._release_on_exit
+                self._release_on_exit = False
+            if release:
+                try:
+                    self._camera.release()
+                except Exception:
+                    # La cámara ya informó el error
+                    pass
+
+    def _put_latest(self, item: Optional[np.ndarray]) -> None:
+        # Solo hay un productor: tras vaciar la cola, put_nowait siempre tiene lugar
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        self._frames.put_nowait(item)
+
+    def read(self) -> np.ndarray:
+        """
+        Devuelve el frame más reciente, esperando como mucho read_timeout segundos.
+
+        Lanza RuntimeError si la cámara no está abierta, si el hilo productor falló
+        o si no llega ningún frame a tiempo.
+        """
+        if self._thread is None or self._stop.is_set():
+            print("[ERROR] Ha ocurrido un error con la cámara: no está inicializada.")
+            raise RuntimeError("Cámara no inicializada. Llama primero a open().")
+
+        try:
+            frame = self._frames.get(timeout=self._read_timeout)
+        except queue.Empty:
+            frame = None
+
+        if frame is not None:
+            return frame
+        if self._error is not None:
+            raise RuntimeError(f"No se pudo leer frame de la cámara: {self._error}") from self._error
+        print("[ERROR] Ha ocurrido un error con la cámara: no llegan frames.")
+        raise RuntimeError("No se pudo leer frame de la cámara")
+
+    def release(self) -> None:
+        """
+        Detiene el hilo productor y libera la cámara envuelta. Si el hilo no termina en
+        read_timeout segundos, la liberación queda a cargo del propio hilo.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self._read_timeout)
+
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if self._producer_running:
+                self._release_on_exit = True
+                return
+        self._camera.release()
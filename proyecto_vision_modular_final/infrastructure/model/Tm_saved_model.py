@@ -4,18 +4,29 @@ predict, para ejecutar la inferencia.
 
     1.- En el constructor verifica que el archivo saved_model.pb exista, intenta cargar la firma
     serving_default y, si algo falla, corta la ejecución con mensajes de error claros.
-    2.-Después, con predict, recibe un tensor ya preprocesado y devuelve las salidas del modelo, que
+    El modelo cargado queda en memoria por carpeta (_load_cached), así crear otra instancia
+    en el mismo proceso no vuelve a leer el SavedModel desde disco.
+    2.-Después, con predict, recibe un tensor ya preprocesado (arreglo numpy o tf.Tensor; se
+    convierte aquí a tf.Tensor) y devuelve las salidas del modelo, que
     luego son convertidas en probabilidades y etiquetas por el motor de inferencia.
     Si ocurre algún error durante la inferencia, también corta la ejecución para evitar decisiones
     incorrectas.
 """
 
+import functools
 import os
 import tensorflow as tf
 
 from interfaces import IModel
 
 
+@functools.lru_cache(maxsize=4)
+def _load_cached(model_dir: str):
+    """Carga el SavedModel una sola vez por carpeta y proceso."""
+    print("Cargando modelo…")
+    return tf.saved_model.load(model_dir)
+
+
 class TMSavedModel(IModel):
     def __init__(self, model_dir: str) -> None:
         self._model_dir = model_dir
@@ -27,16 +38,16 @@ class TMSavedModel(IModel):
             )
 
         try:
-            print("Cargando modelo…")
-            model = tf.saved_model.load(model_dir)
-            self._infer = model.signatures["serving_default"]
+            # Se guarda el modelo además de la firma para mantenerlo vivo
+            self._model = _load_cached(os.path.abspath(model_dir))
+            self._infer = self._model.signatures["serving_default"]
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al cargar el modelo: {e}")
             raise
 
     def predict(self, input_tensor):
         try:
-            return self._infer(input_tensor)
+            return self._infer(tf.convert_to_tensor(input_tensor, dtype=tf.float32))
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al ejecutar la inferencia del modelo: {e}")
             raise
@@ -0,0 +1,125 @@
+"""
+TMTFLiteModel ejecuta el modelo de Teachable Machine convertido a TensorFlow Lite
+(ver tflite_converter.py) y expone el mismo método predict que TMSavedModel.
+
+    1.- En el constructor verifica que el archivo .tflite exista, crea el intérprete y reserva
+    los tensores UNA sola vez; los índices de entrada/salida y sus parámetros de cuantización
+    quedan guardados para no consultarlos en cada frame.
+    Se crea con num_threads hilos (el delegado XNNPACK que traen los intérpretes actuales los usa
+    para las capas float e int8) y, con use_coral=True, intenta cargar el delegado de la Coral Edge
+    TPU; si no está conectada o falta la librería, avisa y sigue en CPU.
+    2.- predict recibe el tensor ya preprocesado (float32, 0–1), lo cuantiza si el modelo es int8,
+    ejecuta el intérprete y devuelve {"logits": ...} en float32, igual que la firma del SavedModel.
+
+Usa tflite_runtime o ai_edge_litert si están instalados (Raspberry Pi y similares) y, si no,
+el intérprete incluido en TensorFlow.
+"""
+
+import os
+import platform
+from typing import Optional
+
+import numpy as np
+
+try:
+    from tflite_runtime.interpreter import Interpreter, load_delegate
+except ImportError:
+    try:
+        from ai_edge_litert.interpreter import Interpreter, load_delegate
+    except ImportError:  # ninguno instalado: se usa el de TensorFlow completo
+        import tensorflow as tf
+
+        Interpreter = tf.lite.Interpreter
+        load_delegate = tf.lite.experimental.load_delegate
+
+from interfaces import IModel
+
+# Nombre de la librería del delegado Edge TPU en cada sistema
+EDGETPU_LIBRARIES = {
+    "Linux": "libedgetpu.so.1",
+    "Darwin": "libedgetpu.1.dylib",
+    "Windows": "edgetpu.dll",
+}
+
+
+def default_num_threads() -> int:
+    """Mitad de los núcleos lógicos (aprox. los físicos), al menos 1."""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class TMTFLiteModel(IModel):
+    def __init__(
+        self,
+        model_path: str,
+        num_threads: Optional[int] = None,
+        use_coral: bool = False,
+    ) -> None:
+        self._model_path = model_path
+        if not os.path.isfile(model_path):
+            raise FileNotFoundError(
+                f"No se encontró el modelo TFLite en {model_path}. "
+                "Genéralo con infrastructure/model/tflite_converter.py o revisa TFLITE_PATH/TFLITE_VARIANT en tu .env."
+            )
+
+        try:
+            print("Cargando modelo TFLite…")
+            delegates = self._load_coral_delegate() if use_coral else []
+            self._interpreter = Interpreter(
+                model_path=model_path,
+                num_threads=num_threads or default_num_threads(),
+                experimental_delegates=delegates or None,
+            )
+            self._interpreter.allocate_tensors()
+
+            input_details = self._interpreter.get_input_details()[0]
+            output_details = self._interpreter.get_output_details()[0]
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al cargar el modelo TFLite: {e}")
+            raise
+
+        self._input_index = input_details["index"]
+        self._input_dtype = input_details["dtype"]
+        self._input_scale, self._input_zero_point = input_details["quantization"]
+
+        self._output_index = output_details["index"]
+        self._output_scale, self._output_zero_point = output_details["quantization"]
+
+        # Modelos int8 completos reciben/devuelven enteros: hay que (de)cuantizar
+        self._quantized_input = self._input_dtype in (np.int8, np.uint8) and self._input_scale > 0
+        self._quantized_output = (
+            output_details["dtype"] in (np.int8, np.uint8) and self._output_scale > 0
+        )
+
+    @staticmethod
+    def _load_coral_delegate() -> list:
+        """Carga el delegado de la Edge TPU; si no se puede, devuelve [] y se usa la CPU."""
+        library = EDGETPU_LIBRARIES.get(platform.system(), EDGETPU_LIBRARIES["Linux"])
+        try:
+            delegate = load_delegate(library)
+        except Exception as e:
+            print(f"[WARN] No se pudo cargar la Coral Edge TPU ({library}): {e}. Se usa la CPU.")
+            return []
+        print("[INFO] Coral Edge TPU activa.")
+        return [delegate]
+
+    def predict(self, input_tensor):
+        try:
+            data = np.asarray(input_tensor, dtype=np.float32)
+            if self._quantized_input:
+                info = np.iinfo(self._input_dtype)
+                data = np.clip(
+                    np.round(data / self._input_scale + self._input_zero_point),
+                    info.min,
+                    info.max,
+                ).astype(self._input_dtype)
+
+            self._interpreter.set_tensor(self._input_index, data)
+            self._interpreter.invoke()
+            logits = self._interpreter.get_tensor(self._output_index)
+
+            if self._quantized_output:
+                logits = (logits.astype(np.float32) - self._output_zero_point) * self._output_scale
+            return {"logits": logits}
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al ejecutar la inferencia del modelo TFLite: {e}")
+            raise
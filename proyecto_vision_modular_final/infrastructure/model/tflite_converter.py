@@ -0,0 +1,138 @@
+"""
+Script de conversión del SavedModel de Teachable Machine a TensorFlow Lite.
+
+Genera dentro de SAVEDMODEL_DIR las variantes definidas en TFLITE_VARIANTS:
+    - model_float16.tflite: pesos en float16, entrada/salida float32.
+    - model_int8.tflite: cuantización entera completa. Se calibra con un dataset representativo
+      armado con fotos REALES de la cámara (carpeta --frames-dir), pasadas por el mismo
+      TMPreprocessor que usa la aplicación; sin ellas la precisión int8 no es confiable.
+
+Con --benchmark mide el tiempo medio por frame de cada variante en ESTE equipo: en CPUs x86
+el int8 puede ser más lento que float16, así que conviene elegir TFLITE_VARIANT según la medición.
+
+Uso (desde la carpeta del proyecto):
+    python -m infrastructure.model.tflite_converter --frames-dir capturas/ --benchmark 100
+"""
+
+import argparse
+import glob
+import os
+import time
+from typing import Callable, Iterator, List, Optional
+
+import cv2
+import numpy as np
+import tensorflow as tf
+
+from config.settings import SettingsManager, TFLITE_VARIANTS
+from core.preprocessing.Tm_preprocessor import TMPreprocessor
+from infrastructure.model.Tm_tflite_model import TMTFLiteModel
+
+# Máximo de fotos usadas para calibrar la cuantización int8
+MAX_CALIBRATION_FRAMES = 200
+
+
+def representative_dataset(
+    frames_dir: str, input_size: int, limit: int = MAX_CALIBRATION_FRAMES
+) -> Callable[[], Iterator[List[np.ndarray]]]:
+    """Devuelve el generador que pide TFLiteConverter, a partir de fotos de la cámara."""
+    paths = sorted(
+        p for ext in ("*.jpg", "*.jpeg", "*.png", "*.bmp")
+        for p in glob.glob(os.path.join(frames_dir, ext))
+    )[:limit]
+    if not paths:
+        raise FileNotFoundError(
+            f"No hay imágenes en {frames_dir} para calibrar el modelo int8."
+        )
+    preprocessor = TMPreprocessor(input_size)
+
+    def generator() -> Iterator[List[np.ndarray]]:
+        for path in paths:
+            frame = cv2.imread(path)
+            if frame is None:
+                print(f"[WARN] No se pudo leer {path}, se omite.")
+                continue
+            yield [preprocessor.preprocess(frame).astype(np.float32)]
+
+    return generator
+
+
+def convert_float16(savedmodel_dir: str) -> bytes:
+    converter = tf.lite.TFLiteConverter.from_saved_model(savedmodel_dir)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.target_spec.supported_types = [tf.float16]
+    return converter.convert()
+
+
+def convert_int8(
+    savedmodel_dir: str, dataset: Callable[[], Iterator[List[np.ndarray]]]
+) -> bytes:
+    converter = tf.lite.TFLiteConverter.from_saved_model(savedmodel_dir)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = dataset
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    return converter.convert()
+
+
+def benchmark(model_path: str, input_size: int, runs: int) -> float:
+    """Tiempo medio (ms) por inferencia del modelo TFLite, tras un primer run de calentamiento."""
+    model = TMTFLiteModel(model_path)
+    dummy = np.random.rand(1, input_size, input_size, 3).astype(np.float32)
+    model.predict(dummy)
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        model.predict(dummy)
+    return (time.perf_counter() - start) * 1000.0 / runs
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convierte el SavedModel a TFLite.")
+    parser.add_argument("--env", default=".env", help="Archivo .env de la aplicación")
+    parser.add_argument(
+        "--frames-dir", help="Carpeta con fotos de la cámara (obligatoria para int8)"
+    )
+    parser.add_argument(
+        "--variants", nargs="+", choices=sorted(TFLITE_VARIANTS), default=sorted(TFLITE_VARIANTS)
+    )
+    parser.add_argument(
+        "--benchmark", type=int, default=0, metavar="N",
+        help="Mide N inferencias de cada variante generada",
+    )
+    args = parser.parse_args(argv)
+
+    settings = SettingsManager.load_from_env(args.env)
+    savedmodel_dir = settings.SAVEDMODEL_DIR
+
+    generated = {}
+    for variant in args.variants:
+        if variant == "int8":
+            if not args.frames_dir:
+                parser.error("--frames-dir es obligatorio para la variante int8")
+            data = convert_int8(
+                savedmodel_dir, representative_dataset(args.frames_dir, settings.INPUT_SIZE)
+            )
+        else:
+            data = convert_float16(savedmodel_dir)
+
+        out_path = os.path.join(savedmodel_dir, TFLITE_VARIANTS[variant])
+        with open(out_path, "wb") as f:
+            f.write(data)
+        generated[variant] = out_path
+        print(f"[INFO] Generado {out_path} ({len(data) / 1024:.0f} KB)")
+
+    if args.benchmark > 0 and generated:
+        times = {
+            variant: benchmark(path, settings.INPUT_SIZE, args.benchmark)
+            for variant, path in generated.items()
+        }
+        for variant, ms in times.items():
+            print(f"[INFO] {variant}: {ms:.2f} ms por frame")
+        best = min(times, key=times.get)
+        print(f"[INFO] Variante más rápida en este equipo: {best} (TFLITE_VARIANT={best})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ ExcelInventoryRepo es el módulo que conecta la aplicación con el inventario en
     la tabla, lo crea con cantidad 0.
     3.-write_qty actualiza o inserta la cantidad en el Excel, corrigiendo valores negativos y 
     guardando siempre la estructura normalizada.
+    4.-adjust_qty suma un delta a la cantidad leyendo y guardando el Excel una sola vez.
 Si algo falla en lectura o escritura, lanza errores claros y detiene el flujo para evitar 
 inconsistencias en los datos.
 '''
@@ -118,3 +119,27 @@ class ExcelInventoryRepo(IInventoryRepo):
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al escribir la cantidad en el Excel: {e}")
             raise
+
+    # ----------------------------------------------------------
+    # Ajustar cantidad (lectura + escritura en una sola pasada)
+    # ----------------------------------------------------------
+    def adjust_qty(self, component_name: str, delta: int) -> int:
+        try:
+            df = pd.read_excel(self._path)
+            df = ExcelInventoryRepo._normalize_df_columns(df)
+
+            mask = df["Componentes"].astype(str).str.strip() == component_name
+
+            if not mask.any():
+                new_qty = max(0, int(delta))
+                df.loc[len(df)] = [component_name, new_qty]
+            else:
+                new_qty = max(0, int(df.loc[mask, "Cantidad"].iloc[0]) + int(delta))
+                df.loc[mask, "Cantidad"] = new_qty
+
+            df.to_excel(self._path, index=False)
+            return new_qty
+
+        except Exception as e:
+            print(f"[ERROR] Ha ocurrido un error al ajustar la cantidad en el Excel: {e}")
+            raise
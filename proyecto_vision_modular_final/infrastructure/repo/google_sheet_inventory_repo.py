@@ -11,39 +11,127 @@ GoogleSheetInventoryRepo conecta la aplicación con un inventario almacenado en
 Comportamiento:
     1.-ensure_schema verifica que exista la hoja y que tenga las columnas correctas
        ("Componentes", "Cantidad"). Si la hoja está vacía o mal formateada, crea un esquema
-       inicial con algunos componentes de ejemplo.
+       inicial con algunos componentes de ejemplo. Tanto la conexión como esta verificación
+       se hacen en la primera lectura/escritura, no al construir el repositorio.
     2.-read_qty lee la cantidad actual para un componente; si no existe la fila, la crea con 0.
     3.-write_qty actualiza o inserta la cantidad, corrigiendo valores negativos.
 
+Para no descargar la hoja completa en cada lectura/escritura, BaseGoogleSheetRepo mantiene
+una copia local de los valores (caché) y un índice nombre -> fila. La caché se recarga solo
+al llamar a refresh() o cada `refresh_every` accesos.
+
+Las actualizaciones de cantidades se acumulan en memoria y se envían juntas con un único
+batch_update (flush) al llegar a `batch_size` escrituras, a los `flush_interval` segundos de
+la primera escritura pendiente (un threading.Timer, aunque no lleguen más escrituras) o al
+cerrar el programa.
+
 Si algo falla (credenciales, permisos, estructura), lanza errores claros para evitar
 inconsistencias silenciosas.
 """
 
-from typing import List
+import atexit
+import re
+import sys
+import threading
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
 
 import gspread
 from google.oauth2.service_account import Credentials
 
 from interfaces import IInventoryRepo
 
+# Clientes y spreadsheets ya abiertos, compartidos entre instancias del repositorio:
+# evita repetir la lectura del JSON de credenciales, el intercambio OAuth y open_by_key.
+_CLIENT_CACHE: Dict[str, gspread.Client] = {}
+_SPREADSHEET_CACHE: Dict[Tuple[str, str], gspread.Spreadsheet] = {}
+
+# Encabezados esperados, internados para que las comparaciones resuelvan por identidad
+_H_COMP = sys.intern("Componentes")
+_H_QTY = sys.intern("Cantidad")
+
+# Repositorios vivos con escrituras que enviar al cerrar el programa. Es un WeakSet con un
+# único hook de atexit: registrar self.flush por instancia mantendría vivo cada repositorio
+_LIVE_REPOS: "weakref.WeakSet[BaseGoogleSheetRepo]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_repos() -> None:
+    for repo in list(_LIVE_REPOS):
+        try:
+            repo.flush()
+        except Exception:
+            # flush ya informó el error
+            pass
+
+
+# Fila final de un rango A1 como "'Hoja 1'!A7:B7" (respuesta de append_row)
+_UPDATED_ROW_RE = re.compile(r"(\d+)$")
+
 
 class BaseGoogleSheetRepo:
     """Clase base que encapsula conexión y utilidades sobre Google Sheets."""
 
-    def __init__(self, spreadsheet_id: str, worksheet_name: str, credentials_path: str) -> None:
+    def __init__(
+        self,
+        spreadsheet_id: str,
+        worksheet_name: str,
+        credentials_path: str,
+        refresh_every: int = 100,
+        batch_size: int = 10,
+        flush_interval: float = 5.0,
+    ) -> None:
         self._spreadsheet_id = spreadsheet_id
         self._worksheet_name = worksheet_name
         self._credentials_path = credentials_path
-        self._ws = self._get_worksheet()
+        # La conexión (credenciales + apertura de la hoja) se hace al primer uso de _ws
+        self._worksheet = None
+
+        # Caché local de la hoja: se evita un get_all_values() por cada operación
+        self._cache: Optional[List[List[str]]] = None
+        self._row_index: Dict[str, int] = {}
+        self._refresh_every = refresh_every
+        self._accesses = 0
+
+        # Escrituras pendientes (fila -> cantidad) que se envían en un solo batch_update
+        self._pending: Dict[int, int] = {}
+        self._pending_writes = 0
+        # Temporizador que hace flush a los flush_interval s de la primera escritura pendiente
+        self._flush_timer: Optional[threading.Timer] = None
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        # _pending_lock protege el diccionario de pendientes; _flush_lock hace que los
+        # batch_update salgan de a uno y en orden (flush puede llegar desde atexit u otro hilo)
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        _LIVE_REPOS.add(self)
+
+    @property
+    def _ws(self):
+        """Worksheet de gspread, obtenida de forma perezosa la primera vez que se usa."""
+        if self._worksheet is None:
+            self._worksheet = self._get_worksheet()
+        return self._worksheet
 
     # ----------------- Métodos reutilizables (herencia real) -----------------
 
     def _build_client(self):
-        scopes = ["https://www.googleapis.com/auth/spreadsheets"]
-        creds = Credentials.from_service_account_file(self._credentials_path, scopes=scopes)
-        client = gspread.authorize(creds)
+        client = _CLIENT_CACHE.get(self._credentials_path)
+        if client is None:
+            scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+            creds = Credentials.from_service_account_file(self._credentials_path, scopes=scopes)
+            client = gspread.authorize(creds)
+            _CLIENT_CACHE[self._credentials_path] = client
         return client
 
+    def _open_spreadsheet(self):
+        key = (self._credentials_path, self._spreadsheet_id)
+        sh = _SPREADSHEET_CACHE.get(key)
+        if sh is None:
+            sh = self._build_client().open_by_key(self._spreadsheet_id)
+            _SPREADSHEET_CACHE[key] = sh
+        return sh
+
     def _get_worksheet(self):
         """
         Obtiene la worksheet; si no existe, la crea.
@@ -51,8 +139,7 @@ class BaseGoogleSheetRepo:
         OJO: no recibe parámetros extras, usa los atributos del objeto, así
         evitamos el problema de "takes 3 args but 4 were given".
         """
-        client = self._build_client()
-        sh = client.open_by_key(self._spreadsheet_id)
+        sh = self._open_spreadsheet()
         try:
             ws = sh.worksheet(self._worksheet_name)
         except gspread.WorksheetNotFound:
@@ -66,23 +153,153 @@ class BaseGoogleSheetRepo:
 
         Si la hoja está vacía, la inicializa con algunos componentes por defecto.
         """
-        values: List[List[str]] = self._ws.get_all_values()
-        if not values:
-            # No hay nada, creamos encabezados y filas de ejemplo
-            self._ws.update("A1:B1", [["Componentes", "Cantidad"]])
-            default_rows = [
+        # Solo se descarga la primera fila, no la hoja completa
+        headers: List[str] = self._ws.row_values(1)
+        if not headers:
+            # No hay nada, creamos encabezados y filas de ejemplo en una sola llamada
+            seed_rows = [
+                [_H_COMP, _H_QTY],
                 ["Modulos Rele de Doble canal", 0],
                 ["Diodo Zener", 0],
                 ["7805", 0],
                 ["7404", 0],
             ]
-            self._ws.update("A2:B5", default_rows)
+            self._ws.update("A1:B5", seed_rows)
             return
 
-        headers = values[0]
-        if len(headers) < 2 or headers[0] != "Componentes" or headers[1] != "Cantidad":
+        if len(headers) < 2 or headers[0] != _H_COMP or headers[1] != _H_QTY:
             # Reseteamos encabezados pero no borramos datos ya existentes
-            self._ws.update("A1:B1", [["Componentes", "Cantidad"]])
+            self._ws.update("A1:B1", [[_H_COMP, _H_QTY]])
+
+    # ----------------- Caché local de la hoja -----------------
+
+    def _load_cache(self) -> List[List[str]]:
+        """
+        Descarga todos los valores de la hoja una sola vez y construye el índice
+        nombre de componente -> número de fila (1-based, como en Sheets).
+        """
+        # Lo pendiente se envía antes, para no pisar la caché con datos viejos
+        self.flush()
+        values: List[List[str]] = self._ws.get_all_values()
+        row_index: Dict[str, int] = {}
+        for idx, row in enumerate(values[1:], start=2):  # fila 2 en adelante
+            if row:
+                row_index.setdefault(sys.intern(row[0].strip()), idx)
+
+        self._cache = values
+        self._row_index = row_index
+        self._accesses = 0
+        return values
+
+    def _cached_values(self) -> List[List[str]]:
+        """
+        Devuelve los valores en caché; recarga si no hay caché o si se superó
+        el umbral de accesos `refresh_every` (para captar cambios externos).
+        """
+        self._accesses += 1
+        if self._cache is None or (
+            self._refresh_every > 0 and self._accesses > self._refresh_every
+        ):
+            return self._load_cache()
+        return self._cache
+
+    def _append_component(self, component_name: str, qty: int) -> None:
+        """
+        Agrega una fila nueva y la registra en la caché/índice usando la fila que
+        devuelve la API, sin volver a descargar la hoja completa.
+        """
+        response = self._ws.append_row([component_name, qty])
+        row_number = self._row_from_append_response(response)
+        if self._cache is None or row_number is None:
+            self.refresh()
+            return
+
+        while len(self._cache) < row_number:
+            self._cache.append([])
+        self._cache[row_number - 1] = [component_name, str(qty)]
+        self._row_index.setdefault(component_name, row_number)
+
+    @staticmethod
+    def _row_from_append_response(response: Any) -> Optional[int]:
+        """Extrae el número de fila escrito a partir de la respuesta de append_row."""
+        try:
+            updated_range = response["updates"]["updatedRange"]
+        except (TypeError, KeyError):
+            return None
+        match = _UPDATED_ROW_RE.search(updated_range)
+        return int(match.group(1)) if match else None
+
+    def _queue_update(self, row_number: int, qty: int) -> None:
+        """
+        Registra la cantidad de una fila para el próximo batch_update y hace flush
+        si se alcanzó `batch_size`; si no, el temporizador lo hará a los `flush_interval` s.
+        """
+        with self._pending_lock:
+            self._pending[row_number] = qty
+            self._pending_writes += 1
+            due = self._pending_writes >= self._batch_size
+            if not due:
+                self._arm_flush_timer()
+
+        if due:
+            self.flush()
+
+    def _arm_flush_timer(self) -> None:
+        """Arranca el temporizador de flush si no hay uno en marcha (llamar con _pending_lock)."""
+        if self._flush_timer is not None or self._flush_interval <= 0:
+            return
+        self._flush_timer = threading.Timer(self._flush_interval, self._flush_on_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _flush_on_timer(self) -> None:
+        with self._pending_lock:
+            self._flush_timer = None
+        try:
+            self.flush()
+        except Exception:
+            # flush ya informó el error y devolvió los cambios a la cola (se reintenta)
+            pass
+
+    def flush(self) -> None:
+        """
+        Envía todas las cantidades pendientes en una sola llamada a la API.
+
+        Los pendientes se sacan del diccionario antes de la llamada de red: lo que se
+        escriba mientras tanto queda para el próximo flush. Si la llamada falla, se
+        devuelven a la cola sin pisar valores más nuevos.
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return
+                pending, self._pending = self._pending, {}
+                self._pending_writes = 0
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+
+            data = [
+                {"range": f"B{row_number}", "values": [[qty]]}
+                for row_number, qty in sorted(pending.items())
+            ]
+            try:
+                self._ws.batch_update(data)
+            except Exception as e:
+                print(f"[ERROR] Ha ocurrido un error al enviar cambios pendientes a Google Sheets: {e}")
+                with self._pending_lock:
+                    for row_number, qty in pending.items():
+                        if row_number not in self._pending:
+                            self._pending[row_number] = qty
+                            self._pending_writes += 1
+                    self._arm_flush_timer()
+                raise
+
+    def refresh(self) -> None:
+        """Invalida la caché local; la siguiente operación vuelve a leer la hoja."""
+        self.flush()
+        self._cache = None
+        self._row_index = {}
 
 
 class GoogleSheetInventoryRepo(BaseGoogleSheetRepo, IInventoryRepo):
@@ -90,7 +307,8 @@ class GoogleSheetInventoryRepo(BaseGoogleSheetRepo, IInventoryRepo):
 
     def __init__(self, spreadsheet_id: str, worksheet_name: str, credentials_path: str) -> None:
         super().__init__(spreadsheet_id, worksheet_name, credentials_path)
-        self.ensure_schema()
+        # El esquema se verifica en la primera lectura/escritura, no al construir
+        self._schema_ready = False
 
     # ----------------- API pública del repositorio -----------------
 
@@ -98,10 +316,16 @@ class GoogleSheetInventoryRepo(BaseGoogleSheetRepo, IInventoryRepo):
         """Verifica/crea cabeceras mínimas. Lanza error si algo sale mal."""
         try:
             self._ensure_headers()
+            self._schema_ready = True
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al verificar/crear la hoja de Google Sheets: {e}")
             raise
 
+    def _ensure_ready(self) -> None:
+        """Ejecuta ensure_schema una sola vez, justo antes del primer acceso real."""
+        if not self._schema_ready:
+            self.ensure_schema()
+
     def read_qty(self, component_name: str) -> int:
         """
         Lee la cantidad actual para un componente.
@@ -109,21 +333,24 @@ class GoogleSheetInventoryRepo(BaseGoogleSheetRepo, IInventoryRepo):
         Si la fila no existe, la crea con cantidad 0 y devuelve 0.
         """
         try:
-            values = self._ws.get_all_values()
+            component_name = sys.intern(component_name)
+            self._ensure_ready()
+            values = self._cached_values()
             if not values:
                 self._ensure_headers()
+                self.refresh()
                 return 0
 
-            rows = values[1:]  # sin encabezado
-            for idx, row in enumerate(rows, start=2):  # fila 2 en adelante
-                if row and row[0].strip() == component_name:
-                    try:
-                        return int(row[1])
-                    except (ValueError, IndexError):
-                        return 0
+            idx = self._row_index.get(component_name)
+            if idx is not None:
+                row = values[idx - 1]
+                try:
+                    return int(row[1])
+                except (ValueError, IndexError):
+                    return 0
 
             # Si no existe, la creamos con cantidad 0
-            self._ws.append_row([component_name, 0])
+            self._append_component(component_name, 0)
             return 0
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al leer la cantidad desde Google Sheets: {e}")
@@ -139,18 +366,23 @@ class GoogleSheetInventoryRepo(BaseGoogleSheetRepo, IInventoryRepo):
             if qty < 0:
                 qty = 0
 
-            values = self._ws.get_all_values()
+            component_name = sys.intern(component_name)
+            self._ensure_ready()
+            values = self._cached_values()
             if not values:
                 self._ensure_headers()
-                values = self._ws.get_all_values()
+                values = self._load_cache()
 
-            rows = values[1:]
-            for idx, row in enumerate(rows, start=2):
-                if row and row[0].strip() == component_name:
-                    self._ws.update_cell(idx, 2, int(qty))
-                    break
+            idx = self._row_index.get(component_name)
+            if idx is not None:
+                self._queue_update(idx, int(qty))
+                # Mantener la caché al día sin volver a descargar la hoja
+                row = values[idx - 1]
+                if len(row) < 2:
+                    row.extend([""] * (2 - len(row)))
+                row[1] = str(int(qty))
             else:
-                self._ws.append_row([component_name, int(qty)])
+                self._append_component(component_name, int(qty))
         except Exception as e:
             print(f"[ERROR] Ha ocurrido un error al escribir la cantidad en Google Sheets: {e}")
             raise
@@ -5,6 +5,7 @@ Json InventoryRepo es el módulo que conecta la aplicación con el inventario en
     3.-write_qty actualiza o inserta la cantidad en el json, corrigiendo valores negativos y 
     guardando siempre la estructura normalizada.
     4._read_qty permite leer la cantidad actual de un componente, y si el componente no está en
+    5.-adjust_qty suma un delta a la cantidad abriendo el json una sola vez para leer y otra para guardar.
 Si algo falla en lectura o escritura, lanza errores claros y detiene el flujo para evitar 
 inconsistencias en los datos.
 '''
@@ -54,4 +55,16 @@ class JsonInventoryRepo(IInventoryRepo):
         except Exception as e:
             raise RuntimeError(f"Error al escribir la cantidad del componente '{component_name}': {e}")
 
+    def adjust_qty(self, component_name: str, delta: int) -> int:
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            new_qty = max(0, int(data.get(component_name, 0)) + int(delta))
+            data[component_name] = new_qty
+            with open(self._path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=4)
+            return new_qty
+        except Exception as e:
+            raise RuntimeError(f"Error al ajustar la cantidad del componente '{component_name}': {e}")
+
 
@@ -2,23 +2,37 @@
 MultiInventoryRepo sincroniza varios repositorios de inventario al mismo tiempo.
 
 Implementa IInventoryRepo y delega:
-    - read_qty: al primer repositorio de la lista (la "fuente principal").
-    - write_qty: a TODOS los repos (ej. Excel + Google Sheets).
+    - read_qty: al primer repositorio de la lista (la "fuente principal"). Las cantidades
+      escritas con éxito en la fuente principal se guardan en memoria durante `cache_ttl`
+      segundos, así una lectura justo después de escribir no vuelve a consultar el backend.
+    - write_qty: a TODOS los repos (ej. Excel + Google Sheets), en paralelo con un
+      hilo por repositorio, de modo que la latencia total es la del backend más lento
+      y no la suma de todos.
 
 Si alguno falla en write_qty, muestra el error pero intenta seguir con los demás,
 para evitar que un backend externo deje al sistema inconsistente.
 """
 
-from typing import List
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Tuple
 
 from interfaces import IInventoryRepo
 
 
 class MultiInventoryRepo(IInventoryRepo):
-    def __init__(self, repos: List[IInventoryRepo]) -> None:
+    def __init__(self, repos: List[IInventoryRepo], cache_ttl: float = 30.0) -> None:
         if not repos:
             raise ValueError("MultiInventoryRepo requiere al menos un repositorio interno.")
         self._repos = repos
+        # Un hilo por repositorio para escribir en todos a la vez
+        self._pool = ThreadPoolExecutor(
+            max_workers=len(repos), thread_name_prefix="multi-inventory"
+        )
+
+        # Caché de escritura: componente -> (cantidad, instante en que se escribió)
+        self._cache: Dict[str, Tuple[int, float]] = {}
+        self._cache_ttl = cache_ttl
 
     def ensure_schema(self) -> None:
         """
@@ -29,25 +43,45 @@ class MultiInventoryRepo(IInventoryRepo):
 
     def read_qty(self, component_name: str) -> int:
         """
-        Lee siempre del primer repositorio (fuente principal).
+        Lee del primer repositorio (fuente principal), salvo que el valor se haya
+        escrito hace menos de `cache_ttl` segundos: en ese caso se devuelve desde memoria.
         """
+        cached = self._cache.get(component_name)
+        if cached is not None:
+            qty, written_at = cached
+            if time.monotonic() - written_at < self._cache_ttl:
+                return qty
+            self._cache.pop(component_name, None)
+
         return self._repos[0].read_qty(component_name)
 
     def write_qty(self, component_name: str, qty: int) -> None:
         """
-        Escribe en TODOS los repos.
+        Escribe en TODOS los repos en paralelo y espera a que terminen.
 
         Si alguno falla, muestra el error, pero intenta seguir con los demás
         para no depender de un solo backend externo.
         """
+        futures = {
+            self._pool.submit(repo.write_qty, component_name, qty): repo
+            for repo in self._repos
+        }
+
         errors = []
-        for repo in self._repos:
+        for future in as_completed(futures):
+            repo = futures[future]
             try:
-                repo.write_qty(component_name, qty)
+                future.result()
             except Exception as e:
                 repo_name = type(repo).__name__
                 print(f"[WARN] Falló write_qty en {repo_name}: {e}")
                 errors.append((repo_name, e))
+                if repo is self._repos[0]:
+                    # La fuente principal no tiene el valor: no se puede servir desde memoria
+                    self._cache.pop(component_name, None)
+            else:
+                if repo is self._repos[0]:
+                    self._cache[component_name] = (max(0, int(qty)), time.monotonic())
 
         if errors:
             # Opcional: puedes decidir si quieres elevar una excepción global
@@ -4,6 +4,7 @@ Interfaces que definen los contratos para cada componente del sistema.
     2.-IPreprocessor define el método para preprocesar imágenes antes de la infer
     3.-IModel define el método para ejecutar la inferencia en el modelo de IA.
     4.-IInventoryRepo define los métodos para leer y escribir cantidades en el inventario
+      (adjust_qty suma un delta y devuelve la cantidad nueva en una sola operación).
     5.-IDetailUI define el método para mostrar la interfaz gráfica de detalle del componente.
     6.-IController define el método para iniciar el flujo principal de la aplicación.
 Cada interfaz usa métodos abstractos para garantizar que las implementaciones concretas cumplan
@@ -54,6 +55,15 @@ class IInventoryRepo(ABC):
     def write_qty(self, component_name: str, qty: int) -> None:
         ...
 
+    def adjust_qty(self, component_name: str, delta: int) -> int:
+        """
+        Suma `delta` a la cantidad actual (sin bajar de 0) y devuelve la cantidad nueva.
+        Los repositorios pueden sobrescribirlo para hacer la lectura y la escritura juntas.
+        """
+        new_qty = max(0, self.read_qty(component_name) + int(delta))
+        self.write_qty(component_name, new_qty)
+        return new_qty
+
 
 class IDetailUI(ABC):
     @abstractmethod
@@ -8,9 +8,9 @@ Flujo general:
    las rutas/parámetros críticos con AppSettingsValidator.
 
 2. Inicializa:
-   - Cámara (OpenCVCamera)
+   - Cámara (OpenCVCamera, leída en un hilo aparte con ThreadedCamera)
    - Preprocesador (TMPreprocessor)
-   - Modelo IA (TMSavedModel o GoogleVisionModel)
+   - Modelo IA (TMSavedModel, TMTFLiteModel o GoogleVisionModel)
    - Repositorio de inventario (Excel, Google Sheets o MultiInventoryRepo)
    - Interfaz gráfica de detalle (TkDetailUI)
 
@@ -21,19 +21,28 @@ Flujo general:
    evitar fallos silenciosos.
 """
 
+import os
+import platform
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import Tk
+from typing import Any, Callable, Dict, Optional, Sequence
 
-from config.settings import SettingsManager
+import numpy as np
+
+from config.settings import AppSettings, SettingsManager, TFLITE_VARIANTS
 from config.bootstrap import AppSettingsValidator
 from config.assets import DefaultAssetRegistry
 
+from interfaces import IInventoryRepo, IModel
+
 from infrastructure.camera.opencv_camera import OpenCVCamera
+from infrastructure.camera.threaded_camera import ThreadedCamera
 from infrastructure.model.Tm_saved_model import TMSavedModel
-from infrastructure.model.google_vision_model import GoogleVisionModel
 
 from infrastructure.repo.excel_inventory_repo import ExcelInventoryRepo
-from infrastructure.repo.google_sheet_inventory_repo import GoogleSheetInventoryRepo
 from infrastructure.repo.multi_inventory_repo import MultiInventoryRepo
+# GoogleVisionModel y GoogleSheetInventoryRepo se importan solo en la rama que los usa:
+# sus clientes (gRPC/protobuf, gspread) no se cargan si el backend es local/excel.
 
 from core.inference.inference_engine import InferenceEngine
 from core.preprocessing.Tm_preprocessor import TMPreprocessor
@@ -42,6 +51,107 @@ from ui.tk_detail_ui import TkDetailUI
 from app.controller import AppController
 
 
+# MODEL_BACKEND=auto: variantes TFLite a probar según la arquitectura, en orden de preferencia.
+# En ARM el int8 es el más rápido; en x86 los kernels int8 suelen ser más lentos que float,
+# así que ahí solo se prueba float16 y, si no está, se usa el SavedModel (float32).
+ARM_MACHINES = frozenset({"aarch64", "arm64", "armv7l", "armv8l"})
+AUTO_TFLITE_ARM = ("int8", "float16")
+AUTO_TFLITE_OTHER = ("float16",)
+
+
+# ----------------------------------------------------------------------
+# Fábricas de dependencias: nombre del backend en el .env -> función que lo construye.
+# Los backends opcionales importan su módulo dentro de la función (ver arriba).
+# ----------------------------------------------------------------------
+
+def _choices(factories: Dict[str, Callable[..., Any]]) -> str:
+    """'a', 'b' o 'c' a partir de las claves del registro (para los mensajes de error)."""
+    names = [repr(name) for name in factories]
+    return ", ".join(names[:-1]) + " o " + names[-1] if len(names) > 1 else names[0]
+
+
+def _build_excel_repo(settings: AppSettings) -> IInventoryRepo:
+    return ExcelInventoryRepo(settings.EXCEL_PATH)
+
+
+def _build_gsheet_repo(settings: AppSettings) -> IInventoryRepo:
+    from infrastructure.repo.google_sheet_inventory_repo import GoogleSheetInventoryRepo
+
+    return GoogleSheetInventoryRepo(
+        spreadsheet_id=settings.GSHEET_ID,
+        worksheet_name=settings.GSHEET_WORKSHEET,
+        credentials_path=settings.GSHEET_CREDENTIALS,
+    )
+
+
+def _build_multi_repo(settings: AppSettings) -> IInventoryRepo:
+    return MultiInventoryRepo([_build_excel_repo(settings), _build_gsheet_repo(settings)])
+
+
+_REPO_FACTORIES: Dict[str, Callable[[AppSettings], IInventoryRepo]] = {
+    "excel": _build_excel_repo,
+    "google_sheet": _build_gsheet_repo,
+    "multi": _build_multi_repo,
+}
+
+
+def _auto_tflite_path(savedmodel_dir: str, machine: str) -> Optional[str]:
+    """
+    Devuelve el primer modelo TFLite disponible en savedmodel_dir para la
+    arquitectura indicada, o None si conviene usar el SavedModel.
+    """
+    variants = AUTO_TFLITE_ARM if machine.lower() in ARM_MACHINES else AUTO_TFLITE_OTHER
+    for variant in variants:
+        path = os.path.join(savedmodel_dir, TFLITE_VARIANTS[variant])
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def _build_local_model(settings: AppSettings, class_names: Sequence[str]) -> IModel:
+    return TMSavedModel(settings.SAVEDMODEL_DIR)
+
+
+def _build_tflite_model(
+    settings: AppSettings, class_names: Sequence[str], model_path: Optional[str] = None
+) -> IModel:
+    """Crea el modelo TFLite con los hilos y el acelerador configurados."""
+    from infrastructure.model.Tm_tflite_model import TMTFLiteModel
+
+    return TMTFLiteModel(
+        model_path or settings.TFLITE_PATH,
+        num_threads=settings.TFLITE_THREADS or None,
+        use_coral=settings.USE_CORAL,
+    )
+
+
+def _build_auto_model(settings: AppSettings, class_names: Sequence[str]) -> IModel:
+    machine = platform.machine()
+    tflite_path = _auto_tflite_path(settings.SAVEDMODEL_DIR, machine)
+    if tflite_path is None:
+        print(f"[INFO] MODEL_BACKEND=auto ({machine}): usando SavedModel float32.")
+        return _build_local_model(settings, class_names)
+    print(f"[INFO] MODEL_BACKEND=auto ({machine}): usando TFLite {tflite_path}.")
+    return _build_tflite_model(settings, class_names, tflite_path)
+
+
+def _build_google_model(settings: AppSettings, class_names: Sequence[str]) -> IModel:
+    from infrastructure.model.google_vision_model import GoogleVisionModel
+
+    return GoogleVisionModel(
+        credentials_path=settings.GCLOUD_CREDENTIALS,
+        class_names=class_names,
+    )
+
+
+_MODEL_FACTORIES: Dict[str, Callable[[AppSettings, Sequence[str]], IModel]] = {
+    "auto": _build_auto_model,
+    "local": _build_local_model,
+    "tflite": _build_tflite_model,
+    "google": _build_google_model,
+}
+
+
 class Application:
     """
     Clase principal que orquesta la configuración, inicialización de dependencias
@@ -59,13 +169,17 @@ class Application:
         root.withdraw()
         self._root = root
 
-        # 3) Inicializar cámara
-        self._camera = OpenCVCamera(
-            index=self._settings.CAM_INDEX,
-            width=self._settings.FRAME_W,
-            height=self._settings.FRAME_H,
+        # 3) Inicializar cámara. ThreadedCamera la lee en su propio hilo y el controlador
+        #    recibe siempre el último frame, sin esperar a la cámara entre inferencias
+        self._camera = ThreadedCamera(
+            OpenCVCamera(
+                index=self._settings.CAM_INDEX,
+                width=self._settings.FRAME_W,
+                height=self._settings.FRAME_H,
+            )
         )
-        # Si tu controlador NO llama a open(), lo hacemos aquí:
+        # Se abre aquí para fallar pronto si no hay cámara; el open() del controlador
+        # encuentra la cámara ya abierta y no la vuelve a abrir
         self._camera.open()
 
         # 4) Inicializar preprocesador
@@ -79,17 +193,20 @@ class Application:
             img_dir=self._settings.IMG_DIR
         )
 
-        # 7) Inicializar UI de detalle
+        # 7) Inicializar UI de detalle. Las escrituras al inventario van a un hilo aparte
+        #    (uno solo, para que se apliquen en el mismo orden en que se pidieron)
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="inventory-io")
         self._detail_ui = TkDetailUI(
             root=self._root,
             repo=self._repo,
             asset_registry=self._asset_registry,
+            io_pool=self._io_pool,
         )
 
-        # 8) Cargar etiquetas del modelo
-        self._class_names = InferenceEngine.load_labels(
+        # 8) Cargar etiquetas del modelo (tupla: no cambia durante la ejecución)
+        self._class_names = tuple(InferenceEngine.load_labels(
             self._settings.SAVEDMODEL_DIR
-        )
+        ))
 
         # 9) Inicializar backend de modelo
         self._model = self._build_model_backend()
@@ -102,9 +219,15 @@ class Application:
         )
 
         # 11) Clases válidas para inventario (primeras N)
-        self._valid_classes = set(self._class_names[:4])
+        self._valid_classes = frozenset(self._class_names[:4])
+
+        # 12) Precargar en segundo plano las imágenes de las clases válidas
+        self._detail_ui.prewarm(self._valid_classes)
 
-        # 12) Controlador principal
+        # 13) Controlador principal (valida por índice de clase con una máscara booleana)
+        self._valid_mask = np.array(
+            [name in self._valid_classes for name in self._class_names], dtype=bool
+        )
         self._controller = AppController(
             camera=self._camera,
             engine=self._engine,
@@ -114,6 +237,8 @@ class Application:
             no_object_class=self._settings.NO_OBJECT_CLASS,
             threshold=self._settings.THRESHOLD,
             confirm_frames=self._settings.CONFIRM_FRAMES,
+            valid_mask=self._valid_mask,
+            skip_stride_max=self._settings.SKIP_STRIDE_MAX,
         )
 
     # ------------------------------------------------------------------
@@ -123,48 +248,25 @@ class Application:
     def _build_inventory_repo(self):
         """Crea el repositorio de inventario apropiado según la configuración."""
         backend = self._settings.INVENTORY_BACKEND
-
-        if backend == "excel":
-            return ExcelInventoryRepo(self._settings.EXCEL_PATH)
-
-        if backend == "google_sheet":
-            return GoogleSheetInventoryRepo(
-                spreadsheet_id=self._settings.GSHEET_ID,
-                worksheet_name=self._settings.GSHEET_WORKSHEET,
-                credentials_path=self._settings.GSHEET_CREDENTIALS,
-            )
-
-        if backend == "multi":
-            return MultiInventoryRepo([
-                ExcelInventoryRepo(self._settings.EXCEL_PATH),
-                GoogleSheetInventoryRepo(
-                    spreadsheet_id=self._settings.GSHEET_ID,
-                    worksheet_name=self._settings.GSHEET_WORKSHEET,
-                    credentials_path=self._settings.GSHEET_CREDENTIALS,
-                ),
-            ])
-
-        raise ValueError(
-            f"[main] INVENTORY_BACKEND inválido: {backend!r}. "
-            "Usa 'excel', 'google_sheet' o 'multi'."
-        )
+        try:
+            factory = _REPO_FACTORIES[backend]
+        except KeyError:
+            raise ValueError(
+                f"[main] INVENTORY_BACKEND inválido: {backend!r}. "
+                f"Usa {_choices(_REPO_FACTORIES)}."
+            ) from None
+        return factory(self._settings)
 
     def _build_model_backend(self):
         """Crea el backend de modelo IA según la configuración."""
         backend = self._settings.MODEL_BACKEND
-
-        if backend == "local":
-            return TMSavedModel(self._settings.SAVEDMODEL_DIR)
-
-        if backend == "google":
-            return GoogleVisionModel(
-                credentials_path=self._settings.GCLOUD_CREDENTIALS,
-                class_names=self._class_names,
-            )
-
-        raise ValueError(
-            f"[main] MODEL_BACKEND inválido: {backend!r}. Usa 'local' o 'google'."
-        )
+        try:
+            factory = _MODEL_FACTORIES[backend]
+        except KeyError:
+            raise ValueError(
+                f"[main] MODEL_BACKEND inválido: {backend!r}. Usa {_choices(_MODEL_FACTORIES)}."
+            ) from None
+        return factory(self._settings, self._class_names)
 
     # ------------------------------------------------------------------
     # Ejecución
@@ -172,7 +274,15 @@ class Application:
 
     def run(self) -> None:
         """Ejecuta el bucle principal de la aplicación."""
-        self._controller.run(self._root)
+        try:
+            self._controller.run(self._root)
+        finally:
+            # Enviar los clics acumulados y esperar a que terminen las escrituras. El
+            # controlador ya destruyó root; shutdown va aparte para correr aunque flush falle
+            try:
+                self._detail_ui.flush()
+            finally:
+                self._io_pool.shutdown(wait=True)
 
 
 def main() -> None:
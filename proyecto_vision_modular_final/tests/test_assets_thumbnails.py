@@ -0,0 +1,70 @@
+'''
+Test de las miniaturas del registro de assets.
+    1.-get_thumbnail_path arma la ruta img_dir/_thumbs/<nombre>_200.png a partir de la imagen original.
+    2.-get_image_path devuelve siempre la imagen original (es la clave de la caché de la UI),
+      exista o no la miniatura.
+    3.-TkDetailUI._load_pil_image guarda la miniatura la primera vez y en las siguientes la lee
+      en lugar de la original.
+    4.-Si la imagen original es más nueva que su miniatura, la miniatura se vuelve a generar.
+'''
+
+import os
+
+from PIL import Image
+
+from config.assets import DefaultAssetRegistry
+from ui.tk_detail_ui import TkDetailUI
+
+
+def test_thumbnail_path_is_built_from_image_name(tmp_path):
+    registry = DefaultAssetRegistry(str(tmp_path))
+
+    thumb = registry.get_thumbnail_path("7805")
+    assert thumb == os.path.join(str(tmp_path), "_thumbs", "7805_200.png")
+    assert registry.get_thumbnail_path("Desconocido") is None
+
+
+def test_image_path_stays_original_with_thumbnail(tmp_path):
+    registry = DefaultAssetRegistry(str(tmp_path))
+    original = os.path.join(str(tmp_path), "7805.jpg")
+    assert registry.get_image_path("7805") == original
+
+    thumb = registry.get_thumbnail_path("7805")
+    os.makedirs(os.path.dirname(thumb))
+    open(thumb, "wb").close()
+
+    assert registry.get_image_path("7805") == original
+    assert registry.get_image_path("7404") == os.path.join(str(tmp_path), "74LS04-pinout.jpg")
+
+
+def test_loader_creates_then_reads_thumbnail(tmp_path):
+    registry = DefaultAssetRegistry(str(tmp_path))
+    original = registry.get_image_path("7805")
+    thumb = registry.get_thumbnail_path("7805")
+    Image.new("RGB", (800, 400), "white").save(original)
+
+    img = TkDetailUI._load_pil_image(original, thumb)
+    assert img.size == (200, 100)
+    assert os.path.isfile(thumb)
+
+    # Si existe la miniatura se lee esa, no la original
+    Image.new("RGB", (50, 50), "red").save(thumb)
+    assert TkDetailUI._load_pil_image(original, thumb).size == (50, 50)
+
+
+def test_stale_thumbnail_is_rebuilt(tmp_path):
+    registry = DefaultAssetRegistry(str(tmp_path))
+    original = registry.get_image_path("7805")
+    thumb = registry.get_thumbnail_path("7805")
+    Image.new("RGB", (800, 400), "white").save(original)
+    TkDetailUI._load_pil_image(original, thumb)
+
+    # Se reemplaza la original por una imagen distinta y más nueva que la miniatura
+    Image.new("RGB", (400, 800), "black").save(original)
+    thumb_mtime = os.path.getmtime(thumb)
+    os.utime(original, (thumb_mtime + 10, thumb_mtime + 10))
+
+    img = TkDetailUI._load_pil_image(original, thumb)
+    assert img.size == (100, 200)
+    with Image.open(thumb) as saved:
+        assert saved.size == (100, 200)
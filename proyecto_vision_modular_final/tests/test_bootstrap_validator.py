@@ -0,0 +1,95 @@
+'''
+Tests del validador de configuración (AppSettingsValidator).
+    1.-make_settings construye un AppSettings mínimo apuntando a carpetas temporales.
+    2.-test_valid_settings valida que una configuración correcta no lance errores.
+    3.-Los demás tests validan los errores ante rutas o parámetros faltantes y que
+      una carpeta compartida por varias rutas se consulte una sola vez.
+'''
+
+import os
+
+import pytest
+
+from config import bootstrap
+from config.bootstrap import AppSettingsValidator
+from config.settings import AppSettings
+
+
+def make_settings(tmp_path, **overrides):
+    (tmp_path / "modelo").mkdir(exist_ok=True)
+    (tmp_path / "img").mkdir(exist_ok=True)
+    values = dict(
+        SAVEDMODEL_DIR=str(tmp_path / "modelo" / "saved_model"),
+        EXCEL_PATH=str(tmp_path / "inventario.xlsx"),
+        IMG_DIR=str(tmp_path / "img"),
+        INPUT_SIZE=224,
+        FRAME_W=640,
+        FRAME_H=480,
+        CAM_INDEX=0,
+        THRESHOLD=0.8,
+        CONFIRM_FRAMES=5,
+        NO_OBJECT_CLASS="No hay nada",
+        MODEL_BACKEND="local",
+        GCLOUD_CREDENTIALS="",
+        INVENTORY_BACKEND="excel",
+        GSHEET_ID="",
+        GSHEET_WORKSHEET="Hoja 1",
+        GSHEET_CREDENTIALS="",
+        INVENTORY_CLASSES=[],
+    )
+    values.update(overrides)
+    return AppSettings(**values)
+
+
+def test_valid_settings(tmp_path):
+    AppSettingsValidator.validate(make_settings(tmp_path))
+
+
+def test_missing_img_dir(tmp_path):
+    settings = make_settings(tmp_path, IMG_DIR=str(tmp_path / "no_existe"))
+    with pytest.raises(FileNotFoundError, match="IMG_DIR"):
+        AppSettingsValidator.validate(settings)
+
+
+def test_gsheet_requires_id_and_credentials(tmp_path):
+    settings = make_settings(tmp_path, INVENTORY_BACKEND="multi")
+    with pytest.raises(ValueError, match="GSHEET_ID"):
+        AppSettingsValidator.validate(settings)
+
+    settings = make_settings(
+        tmp_path,
+        INVENTORY_BACKEND="multi",
+        GSHEET_ID="abc",
+        GSHEET_CREDENTIALS=str(tmp_path / "img"),
+    )
+    with pytest.raises(FileNotFoundError, match="GSHEET_CREDENTIALS"):
+        AppSettingsValidator.validate(settings)
+
+
+def test_shared_parent_is_stat_once(tmp_path, monkeypatch):
+    settings = make_settings(
+        tmp_path,
+        SAVEDMODEL_DIR=str(tmp_path / "img" / "saved_model"),
+        EXCEL_PATH=str(tmp_path / "img" / "inventario.xlsx"),
+    )
+    calls = []
+    real_stat = os.stat
+
+    def counting_stat(path, *args, **kwargs):
+        calls.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(bootstrap.os, "stat", counting_stat)
+    AppSettingsValidator.validate(settings)
+
+    assert calls == [str(tmp_path / "img")]
+
+
+def test_tflite_requires_model_file(tmp_path):
+    model_path = tmp_path / "modelo" / "model_float16.tflite"
+    settings = make_settings(tmp_path, MODEL_BACKEND="tflite", TFLITE_PATH=str(model_path))
+    with pytest.raises(FileNotFoundError, match="TFLITE_PATH"):
+        AppSettingsValidator.validate(settings)
+
+    model_path.write_bytes(b"")
+    AppSettingsValidator.validate(settings)
@@ -5,9 +5,14 @@ Test del controlador usando mocks para cámara, UI, preprocesador y modelo.
     3.-FakePre y FakeModel simulan el preprocesador y modelo devolviendo datos fijos
     4.-test_controller_logic valida que el controlador use todos los mocks correctamente
       y procese un frame simulando una detección válida.
+    5.-test_run_confirms_with_valid_mask ejecuta el bucle real (con cv2 y Tk simulados) y valida
+      que la máscara de clases válidas dispare la UI tras confirm_frames frames.
+    6.-test_stable_class_skips_inference valida que, con la clase "sin objeto" estable y confianza
+      alta, solo se infiera 1 de cada skip_stride_max frames.
 '''
 
 import numpy as np
+from app import controller as controller_module
 from interfaces import ICamera, IDetailUI, IModel, IPreprocessor
 from app.controller import AppController
 from core.inference.inference_engine import InferenceEngine
@@ -57,3 +62,97 @@ def test_controller_logic(monkeypatch):
 
     monkeypatch.setattr(controller, "run", fake_run)
     controller.run(None)
+
+
+class FiniteCamera(ICamera):
+    def __init__(self, frames):
+        self.frames = frames
+
+    def open(self): pass
+
+    def read(self):
+        if self.frames == 0:
+            raise RuntimeError("sin más frames")
+        self.frames -= 1
+        return np.zeros((48, 64, 3), dtype=np.uint8)
+
+    def release(self): pass
+
+
+class RecordingUI(IDetailUI):
+    def __init__(self):
+        self.shown = []
+
+    def show(self, label_str, conf, on_resume):
+        self.shown.append(label_str)
+        on_resume()
+
+
+class FakeRoot:
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, fn, *args):
+        self.pending.append((fn, args))
+
+    def update(self):
+        while self.pending:
+            fn, args = self.pending.pop(0)
+            fn(*args)
+
+    def update_idletasks(self): pass
+    def destroy(self): pass
+
+
+def test_run_confirms_with_valid_mask(monkeypatch):
+    monkeypatch.setattr(controller_module.cv2, "imshow", lambda *a: None)
+    monkeypatch.setattr(controller_module.cv2, "waitKey", lambda *a: -1)
+    monkeypatch.setattr(controller_module.cv2, "destroyAllWindows", lambda: None)
+
+    ui = RecordingUI()
+    engine = InferenceEngine(FakePre(), FakeModel(), ["A", "B", "C"])
+    controller = AppController(
+        camera=FiniteCamera(5),
+        engine=engine,
+        ui=ui,
+        class_names=("A", "B", "C"),
+        valid_classes=frozenset({"B"}),
+        no_object_class="A",
+        threshold=0.3,
+        confirm_frames=2,
+    )
+    assert controller._valid_mask.tolist() == [False, True, False]
+
+    controller.run(FakeRoot())
+    assert ui.shown == ["B", "B"]
+
+
+class ConfidentModel(IModel):
+    def predict(self, t): return {"logits": np.array([[10.0, 0.0, 0.0]])}   # "A" casi al 100%
+
+
+def test_stable_class_skips_inference(monkeypatch):
+    monkeypatch.setattr(controller_module.cv2, "imshow", lambda *a: None)
+    monkeypatch.setattr(controller_module.cv2, "waitKey", lambda *a: -1)
+    monkeypatch.setattr(controller_module.cv2, "destroyAllWindows", lambda: None)
+
+    engine = InferenceEngine(FakePre(), ConfidentModel(), ["A", "B", "C"])
+    calls = []
+    predict_index = engine.predict_index
+    monkeypatch.setattr(engine, "predict_index", lambda f: calls.append(1) or predict_index(f))
+
+    controller = AppController(
+        camera=FiniteCamera(9),
+        engine=engine,
+        ui=RecordingUI(),
+        class_names=("A", "B", "C"),
+        valid_classes=frozenset({"B"}),
+        no_object_class="A",
+        threshold=0.5,
+        confirm_frames=2,
+        skip_stride_max=3,
+    )
+    controller.run(FakeRoot())
+
+    # frames 1 y 2 confirman la estabilidad; luego se infiere en los frames 5 y 8
+    assert len(calls) == 4
@@ -0,0 +1,49 @@
+'''
+Tests del cargador de archivos .env.
+    1.-test_load_basic valida el formato KEY=VALUE con espacios, comentarios de línea
+      y comentarios al final.
+    2.-test_load_crlf valida que un .env con finales de línea de Windows se lea igual.
+    3.-test_missing_file valida que un archivo inexistente lance FileNotFoundError.
+'''
+
+import pytest
+
+from config.env_loader import EnvLoader
+
+
+def test_load_basic(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# Configuración\n"
+        "\n"
+        "SAVEDMODEL_DIR=modelo/saved_model\n"
+        "  THRESHOLD = 0.8   # umbral\n"
+        "GSHEET_WORKSHEET=Hoja 1\n"
+        "EMPTY=\n"
+        "SIN_IGUAL\n"
+        "   # KEY=comentada\n"
+        "URL=http://x/y?a=b\n",
+        encoding="utf-8",
+    )
+
+    env = EnvLoader(str(env_file)).load()
+
+    assert env == {
+        "SAVEDMODEL_DIR": "modelo/saved_model",
+        "THRESHOLD": "0.8",
+        "GSHEET_WORKSHEET": "Hoja 1",
+        "EMPTY": "",
+        "URL": "http://x/y?a=b",
+    }
+
+
+def test_load_crlf(tmp_path):
+    env_file = tmp_path / ".env"
+    env_file.write_bytes(b"A=1\r\nB = dos # comentario\r\n# C=3\r\nD=\r\n")
+
+    assert EnvLoader(str(env_file)).load() == {"A": "1", "B": "dos", "D": ""}
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        EnvLoader(str(tmp_path / "no_existe.env")).load()
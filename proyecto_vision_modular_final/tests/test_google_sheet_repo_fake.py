@@ -0,0 +1,237 @@
+'''
+Test del repositorio de Google Sheets usando una worksheet falsa (sin red).
+    1.-FakeWorksheet simula la API de gspread guardando las celdas en memoria y contando
+      cuántas veces se descarga la hoja completa.
+    2.-make_repo construye el repositorio reemplazando _get_worksheet por la hoja falsa.
+    3.-Los tests validan que la caché evita descargas repetidas y que las lecturas/escrituras
+      siguen reflejando el contenido correcto de la hoja.
+    4.-test_write_during_flush_is_not_lost valida que una escritura hecha mientras batch_update
+      está en curso quede para el siguiente flush, y test_failed_flush_keeps_pending que un
+      batch_update fallido no pierda los cambios.
+    5.-test_pending_write_is_flushed_by_timer valida que una sola escritura llegue a la hoja a los
+      flush_interval segundos aunque no haya más escrituras.
+    6.-test_repo_is_not_kept_alive_by_atexit valida que el hook de cierre no impida liberar un
+      repositorio que ya no se usa.
+'''
+
+import gc
+import threading
+import time
+import weakref
+
+import pytest
+
+from infrastructure.repo.google_sheet_inventory_repo import GoogleSheetInventoryRepo
+
+
+class FakeWorksheet:
+    def __init__(self, rows):
+        self.rows = [list(r) for r in rows]
+        self.get_all_values_calls = 0
+        self.batch_update_calls = 0
+
+    def get_all_values(self):
+        self.get_all_values_calls += 1
+        return [list(r) for r in self.rows]
+
+    def row_values(self, row):
+        return list(self.rows[row - 1]) if len(self.rows) >= row else []
+
+    def update(self, rng, values):
+        start = rng.split(":")[0]
+        start_row, start_col = int(start[1:]), ord(start[0]) - ord("A")
+        for offset, row in enumerate(values):
+            idx = start_row - 1 + offset
+            while len(self.rows) <= idx:
+                self.rows.append(["", ""])
+            for col, value in enumerate(row, start=start_col):
+                self.rows[idx][col] = str(value)
+
+    def update_cell(self, row, col, value):
+        self.rows[row - 1][col - 1] = str(value)
+
+    def batch_update(self, data):
+        self.batch_update_calls += 1
+        for item in data:
+            self.update(item["range"], item["values"])
+
+    def append_row(self, row):
+        self.rows.append([str(v) for v in row])
+        n = len(self.rows)
+        return {"updates": {"updatedRange": f"'Hoja 1'!A{n}:B{n}"}}
+
+
+def make_repo(monkeypatch, rows):
+    ws = FakeWorksheet(rows)
+    ws.opened = 0
+
+    def fake_get_worksheet(self):
+        ws.opened += 1
+        return ws
+
+    monkeypatch.setattr(GoogleSheetInventoryRepo, "_get_worksheet", fake_get_worksheet)
+    repo = GoogleSheetInventoryRepo("sheet-id", "Hoja 1", "creds.json")
+    return repo, ws
+
+
+def test_connection_is_lazy(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"]])
+    assert ws.opened == 0
+    assert ws.get_all_values_calls == 0
+
+    assert repo.read_qty("7805") == 3
+    assert repo.read_qty("7805") == 3
+    assert ws.opened == 1
+
+
+def test_reads_use_cache(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"], ["7404", "1"]])
+
+    assert repo.read_qty("7805") == 3
+    calls_after_first_read = ws.get_all_values_calls
+    assert repo.read_qty("7404") == 1
+    assert repo.read_qty("7805") == 3
+    assert ws.get_all_values_calls == calls_after_first_read
+
+
+def test_write_updates_sheet_and_cache(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"]])
+
+    repo.write_qty("7805", 7)
+    assert repo.read_qty("7805") == 7
+    repo.flush()
+    assert ws.rows[1] == ["7805", "7"]
+
+    repo.write_qty("7805", -2)
+    assert repo.read_qty("7805") == 0
+
+
+def test_missing_component_is_created(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"]])
+
+    assert repo.read_qty("Diodo Zener") == 0
+    assert ws.rows[-1] == ["Diodo Zener", "0"]
+
+    repo.write_qty("Diodo Zener", 4)
+    assert repo.read_qty("Diodo Zener") == 4
+    repo.flush()
+    assert ws.rows[-1] == ["Diodo Zener", "4"]
+
+
+def test_appended_rows_are_indexed_without_reload(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"]])
+    assert repo.read_qty("7805") == 3
+    calls = ws.get_all_values_calls
+
+    repo.write_qty("7404", 2)
+    repo.write_qty("7404", 5)
+
+    assert repo.read_qty("7404") == 5
+    assert ws.get_all_values_calls == calls
+    repo.flush()
+    assert ws.rows[-1] == ["7404", "5"]
+
+
+def test_writes_are_flushed_in_one_batch(monkeypatch):
+    rows = [["Componentes", "Cantidad"], ["7805", "0"], ["7404", "0"], ["Diodo Zener", "0"]]
+    repo, ws = make_repo(monkeypatch, rows)
+    repo._batch_size = 3
+
+    repo.write_qty("7805", 1)
+    repo.write_qty("7404", 2)
+    assert ws.batch_update_calls == 0
+    assert ws.rows[1] == ["7805", "0"]
+
+    repo.write_qty("Diodo Zener", 3)
+    assert ws.batch_update_calls == 1
+    assert ws.rows[1:] == [["7805", "1"], ["7404", "2"], ["Diodo Zener", "3"]]
+
+
+def test_empty_sheet_gets_schema(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [])
+
+    assert repo.read_qty("7805") == 0
+    assert ws.rows[0] == ["Componentes", "Cantidad"]
+    assert ["7805", "0"] in ws.rows
+
+
+def test_adjust_qty_uses_cache_and_single_batch(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"]])
+    assert repo.read_qty("7805") == 3
+    calls = ws.get_all_values_calls
+
+    assert repo.adjust_qty("7805", +1) == 4
+    assert repo.adjust_qty("7805", -10) == 0
+    assert ws.get_all_values_calls == calls
+
+    repo.flush()
+    assert ws.batch_update_calls == 1
+    assert ws.rows[1] == ["7805", "0"]
+
+
+def test_write_during_flush_is_not_lost(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "0"]])
+    repo.write_qty("7805", 1)
+
+    in_batch = threading.Event()
+    resume = threading.Event()
+    original_batch_update = ws.batch_update
+
+    def slow_batch_update(data):
+        in_batch.set()
+        resume.wait(timeout=5)
+        original_batch_update(data)
+
+    ws.batch_update = slow_batch_update
+    flusher = threading.Thread(target=repo.flush)
+    flusher.start()
+    assert in_batch.wait(timeout=5)
+
+    repo.write_qty("7805", 2)
+    resume.set()
+    flusher.join(timeout=5)
+    assert ws.rows[1] == ["7805", "1"]
+
+    repo.flush()
+    assert ws.rows[1] == ["7805", "2"]
+
+
+def test_failed_flush_keeps_pending(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "0"]])
+    repo.write_qty("7805", 4)
+
+    original_batch_update = ws.batch_update
+
+    def failing_batch_update(data):
+        raise ConnectionError("sin red")
+
+    ws.batch_update = failing_batch_update
+    with pytest.raises(ConnectionError):
+        repo.flush()
+
+    ws.batch_update = original_batch_update
+    repo.flush()
+    assert ws.rows[1] == ["7805", "4"]
+
+
+def test_pending_write_is_flushed_by_timer(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "0"]])
+    repo._flush_interval = 0.05
+
+    repo.write_qty("7805", 1)
+    assert ws.batch_update_calls == 0
+
+    deadline = time.monotonic() + 2.0
+    while ws.batch_update_calls == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert ws.batch_update_calls == 1
+    assert ws.rows[1] == ["7805", "1"]
+
+
+def test_repo_is_not_kept_alive_by_atexit(monkeypatch):
+    repo, ws = make_repo(monkeypatch, [["Componentes", "Cantidad"], ["7805", "3"]])
+    ref = weakref.ref(repo)
+
+    del repo
+    gc.collect()
+    assert ref() is None
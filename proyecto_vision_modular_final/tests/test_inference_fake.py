@@ -4,6 +4,10 @@ Test de integración del motor de inferencia con preprocesador y modelo falsos.
     2.-FakeModel simula el modelo devolviendo logits fijos que corresponden a una clase conocida.
     3.-test_inference_works valida que InferenceEngine use ambos para devolver la etiqueta y confianza
       correctas según los logits simulados.
+    4.-test_load_labels_is_cached valida que load_labels lea labels.txt una sola vez por carpeta y
+      que cada llamada devuelva una lista independiente.
+    5.-test_probs_match_softmax valida que la softmax hecha con NumPy sume 1 y acepte logits enteros
+      o no contiguos sin cambiar la clase elegida.
 '''
 
 import numpy as np
@@ -33,3 +37,42 @@ def test_inference_works():
     assert conf > 0.1
     assert conf < 0.6
     assert len(probs) == 3
+
+
+def test_load_labels_is_cached(tmp_path):
+    labels_file = tmp_path / "labels.txt"
+    labels_file.write_text("A\nB\n", encoding="utf-8")
+
+    first = InferenceEngine.load_labels(str(tmp_path))
+    assert first == ["A", "B"]
+    first.append("X")
+
+    labels_file.write_text("Z\n", encoding="utf-8")
+    assert InferenceEngine.load_labels(str(tmp_path)) == ["A", "B"]
+
+
+class ArrayModel(IModel):
+    def __init__(self, logits):
+        self.logits = logits
+
+    def predict(self, tensor):
+        return {"logits": self.logits}
+
+
+def test_probs_match_softmax():
+    logits = np.array([[1.0, 3.0, 2.0]])
+    engine = InferenceEngine(FakePreprocessor(), ArrayModel(logits), ["A", "B", "C"])
+    label, conf, probs = engine.predict(None)
+
+    expected = np.exp(logits[0] - 3.0) / np.exp(logits[0] - 3.0).sum()
+    assert label == "B"
+    assert probs.dtype == np.float32
+    assert np.allclose(probs, expected)
+    assert np.isclose(probs.sum(), 1.0)
+
+    # logits int8 y vista no contigua (columnas invertidas)
+    int_logits = np.array([[2, 3, 9]], dtype=np.int8)[:, ::-1]
+    engine = InferenceEngine(FakePreprocessor(), ArrayModel(int_logits), ("A", "B", "C"))
+    label, conf, _ = engine.predict(None)
+    assert label == "A"
+    assert conf > 0.99
@@ -0,0 +1,30 @@
+'''
+Test de la selección automática del modelo (MODEL_BACKEND=auto).
+    1.-En ARM se prefiere el TFLite int8 y, si no existe, el float16.
+    2.-En x86 nunca se elige int8: se usa float16 si existe.
+    3.-Si no hay ningún .tflite disponible se devuelve None (se usa el SavedModel).
+'''
+
+from main import _auto_tflite_path
+
+
+def touch(path):
+    open(path, "wb").close()
+    return str(path)
+
+
+def test_arm_prefers_int8_then_float16(tmp_path):
+    float16 = touch(tmp_path / "model_float16.tflite")
+    assert _auto_tflite_path(str(tmp_path), "aarch64") == float16
+
+    int8 = touch(tmp_path / "model_int8.tflite")
+    assert _auto_tflite_path(str(tmp_path), "aarch64") == int8
+    assert _auto_tflite_path(str(tmp_path), "armv7l") == int8
+
+
+def test_x86_skips_int8(tmp_path):
+    touch(tmp_path / "model_int8.tflite")
+    assert _auto_tflite_path(str(tmp_path), "x86_64") is None
+
+    float16 = touch(tmp_path / "model_float16.tflite")
+    assert _auto_tflite_path(str(tmp_path), "AMD64") == float16
@@ -0,0 +1,88 @@
+'''
+Test de MultiInventoryRepo usando repositorios falsos en memoria.
+    1.-FakeRepo guarda las cantidades en un diccionario y puede simular demoras.
+    2.-BrokenRepo simula un backend externo que siempre falla al escribir.
+    3.-Los tests validan que las escrituras lleguen a todos los repos, en paralelo,
+      que un backend caído no impida escribir en los demás y que las lecturas
+      posteriores a una escritura se sirvan desde memoria.
+'''
+
+import threading
+
+from infrastructure.repo.multi_inventory_repo import MultiInventoryRepo
+from interfaces import IInventoryRepo
+
+
+class FakeRepo(IInventoryRepo):
+    def __init__(self, barrier=None):
+        self.data = {}
+        self.barrier = barrier
+        self.reads = 0
+
+    def ensure_schema(self):
+        pass
+
+    def read_qty(self, component_name):
+        self.reads += 1
+        return self.data.get(component_name, 0)
+
+    def write_qty(self, component_name, qty):
+        if self.barrier is not None:
+            # Solo avanza si todos los repos están escribiendo al mismo tiempo
+            self.barrier.wait(timeout=2)
+        self.data[component_name] = qty
+
+
+class BrokenRepo(FakeRepo):
+    def write_qty(self, component_name, qty):
+        raise RuntimeError("backend caído")
+
+
+def test_write_reaches_all_repos_concurrently():
+    barrier = threading.Barrier(2)
+    first, second = FakeRepo(barrier), FakeRepo(barrier)
+    multi = MultiInventoryRepo([first, second])
+
+    multi.write_qty("7805", 4)
+
+    assert first.data == {"7805": 4}
+    assert second.data == {"7805": 4}
+    assert multi.read_qty("7805") == 4
+
+
+def test_failing_repo_does_not_block_others():
+    good = FakeRepo()
+    multi = MultiInventoryRepo([good, BrokenRepo()])
+
+    multi.write_qty("7404", 2)
+
+    assert good.data == {"7404": 2}
+
+
+def test_read_after_write_is_served_from_memory():
+    primary = FakeRepo()
+    multi = MultiInventoryRepo([primary, FakeRepo()])
+
+    multi.write_qty("7805", -3)
+
+    assert multi.read_qty("7805") == 0
+    assert primary.reads == 0
+
+
+def test_expired_cache_reads_primary():
+    primary = FakeRepo()
+    multi = MultiInventoryRepo([primary], cache_ttl=0)
+
+    multi.write_qty("7805", 5)
+    primary.data["7805"] = 9  # cambio externo
+
+    assert multi.read_qty("7805") == 9
+    assert primary.reads == 1
+
+
+def test_failed_primary_write_is_not_cached():
+    multi = MultiInventoryRepo([BrokenRepo(), FakeRepo()])
+
+    multi.write_qty("7805", 5)
+
+    assert multi.read_qty("7805") == 0
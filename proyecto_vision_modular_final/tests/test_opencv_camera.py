@@ -0,0 +1,70 @@
+'''
+Test de OpenCVCamera sin cámara real.
+    1.-FakeCapture reemplaza a cv2.VideoCapture y guarda en orden las propiedades que se configuran.
+    2.-test_open_configures_mjpg_buffer_and_fps valida que open() pida MJPG antes de la resolución,
+      un buffer de 1 frame y 30 FPS.
+    3.-test_optional_settings_can_be_disabled valida que con None no se toque esa propiedad.
+    4.-test_open_twice_reuses_capture valida que un segundo open() no cree otro VideoCapture.
+'''
+
+import cv2
+
+from infrastructure.camera import opencv_camera
+from infrastructure.camera.opencv_camera import OpenCVCamera
+
+
+class FakeCapture:
+    instances = []
+
+    def __init__(self, index, api):
+        self.props = []
+        FakeCapture.instances.append(self)
+
+    def set(self, prop, value):
+        self.props.append((prop, value))
+        return True
+
+    def isOpened(self):
+        return True
+
+    def release(self):
+        pass
+
+
+def make_camera(monkeypatch, **kwargs):
+    FakeCapture.instances = []
+    monkeypatch.setattr(opencv_camera.cv2, "VideoCapture", FakeCapture)
+    return OpenCVCamera(index=0, width=640, height=480, **kwargs)
+
+
+def test_open_configures_mjpg_buffer_and_fps(monkeypatch):
+    camera = make_camera(monkeypatch)
+    camera.open()
+
+    props = FakeCapture.instances[0].props
+    assert props == [
+        (cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"MJPG")),
+        (cv2.CAP_PROP_FRAME_WIDTH, 640),
+        (cv2.CAP_PROP_FRAME_HEIGHT, 480),
+        (cv2.CAP_PROP_BUFFERSIZE, 1),
+        (cv2.CAP_PROP_FPS, 30),
+    ]
+
+
+def test_optional_settings_can_be_disabled(monkeypatch):
+    camera = make_camera(monkeypatch, fourcc=None, buffer_size=None, fps=None)
+    camera.open()
+
+    props = FakeCapture.instances[0].props
+    assert props == [(cv2.CAP_PROP_FRAME_WIDTH, 640), (cv2.CAP_PROP_FRAME_HEIGHT, 480)]
+
+
+def test_open_twice_reuses_capture(monkeypatch):
+    camera = make_camera(monkeypatch)
+    camera.open()
+    camera.open()
+    assert len(FakeCapture.instances) == 1
+
+    camera.release()
+    camera.open()
+    assert len(FakeCapture.instances) == 2
@@ -0,0 +1,55 @@
+'''
+Test de los buffers reservados de TMPreprocessor.
+    1.-test_preprocess_reuses_buffer valida que dos llamadas seguidas devuelvan el MISMO arreglo,
+      ya con los valores del frame nuevo.
+    2.-test_non_uint8_frame_uses_fallback valida que un frame que no es uint8 pase por el camino
+      original (arreglo nuevo) sin tocar el buffer reservado.
+    3.-test_representative_dataset_samples_are_independent valida que las muestras del dataset de
+      calibración int8 sean copias: guardarlas no las pisa con el frame siguiente.
+'''
+
+import cv2
+import numpy as np
+
+from core.preprocessing.Tm_preprocessor import TMPreprocessor
+from infrastructure.model.tflite_converter import representative_dataset
+
+
+def test_preprocess_reuses_buffer():
+    prep = TMPreprocessor(32)
+
+    first = prep.preprocess(np.zeros((48, 64, 3), dtype=np.uint8))
+    assert first.shape == (1, 32, 32, 3)
+    assert np.all(first == 0.0)
+
+    second = prep.preprocess(np.full((48, 64, 3), 255, dtype=np.uint8))
+    assert second is first
+    assert np.allclose(second, 1.0)
+
+
+def test_non_uint8_frame_uses_fallback():
+    prep = TMPreprocessor(32)
+    buf = prep.preprocess(np.zeros((48, 64, 3), dtype=np.uint8))
+
+    frame = np.zeros((48, 64, 3), dtype=np.float32)
+    frame[..., 0] = 255.0  # azul en BGR
+    out = prep.preprocess(frame)
+
+    assert out is not buf
+    assert out.shape == (1, 32, 32, 3)
+    assert out.dtype == np.float32
+    assert np.allclose(out[0, 16, 16], [0.0, 0.0, 1.0])
+    assert np.all(buf == 0.0)
+
+
+def test_representative_dataset_samples_are_independent(tmp_path):
+    for i, value in enumerate((0, 128, 255)):
+        cv2.imwrite(str(tmp_path / f"frame_{i}.png"), np.full((40, 40, 3), value, np.uint8))
+
+    samples = [sample[0] for sample in representative_dataset(str(tmp_path), 16)()]
+
+    assert len(samples) == 3
+    assert not np.shares_memory(samples[0], samples[1])
+    assert np.allclose(samples[0], 0.0)
+    assert np.allclose(samples[1], 128 / 255.0)
+    assert np.allclose(samples[2], 1.0)
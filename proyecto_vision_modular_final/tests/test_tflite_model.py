@@ -0,0 +1,37 @@
+'''
+Test del backend TFLite con un modelo diminuto creado en el momento.
+    1.-make_savedmodel exporta un modelo Keras pequeño como SavedModel en una carpeta temporal.
+    2.-test_tflite_matches_savedmodel convierte ese modelo a float16 con tflite_converter y valida
+      que TMTFLiteModel devuelva {"logits": ...} con los mismos valores que TMSavedModel.
+'''
+
+import numpy as np
+import tensorflow as tf
+
+from infrastructure.model.Tm_saved_model import TMSavedModel
+from infrastructure.model.Tm_tflite_model import TMTFLiteModel
+from infrastructure.model.tflite_converter import convert_float16
+
+
+def make_savedmodel(path):
+    model = tf.keras.Sequential([
+        tf.keras.Input((16, 16, 3)),
+        tf.keras.layers.Conv2D(2, 3, activation="relu"),
+        tf.keras.layers.GlobalAveragePooling2D(),
+        tf.keras.layers.Dense(3),
+    ])
+    model.export(str(path))
+    return str(path)
+
+
+def test_tflite_matches_savedmodel(tmp_path):
+    savedmodel_dir = make_savedmodel(tmp_path / "saved_model")
+    tflite_path = tmp_path / "model_float16.tflite"
+    tflite_path.write_bytes(convert_float16(savedmodel_dir))
+
+    tensor = np.random.rand(1, 16, 16, 3).astype(np.float32)
+    expected = list(TMSavedModel(savedmodel_dir).predict(tf.constant(tensor)).values())[0]
+
+    outputs = TMTFLiteModel(str(tflite_path)).predict(tensor)
+    assert list(outputs) == ["logits"]
+    np.testing.assert_allclose(outputs["logits"], expected.numpy(), atol=1e-2)
@@ -0,0 +1,127 @@
+'''
+Test de ThreadedCamera con una cámara falsa (sin hardware).
+    1.-FakeCamera devuelve frames numerados (con una pausa opcional, como una cámara real) y,
+      al agotarlos, falla como lo haría una cámara desconectada; cuenta cuántas veces se abre
+      y se libera.
+    2.-test_read_returns_latest_frames valida que los frames lleguen en orden creciente (los viejos
+      se descartan, nunca se repiten) y que el error del hilo productor se relance en read().
+    3.-test_open_twice_starts_one_thread valida que un segundo open() no abra la cámara ni cree
+      otro hilo.
+    4.-test_release_stops_thread valida que release() detenga el hilo y libere la cámara envuelta.
+    5.-test_release_waits_for_blocked_read valida que, si el hilo sigue dentro de read(), la cámara
+      no se libere a la vez sino cuando ese read() termina.
+'''
+
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from infrastructure.camera.threaded_camera import ThreadedCamera
+from interfaces import ICamera
+
+
+class FakeCamera(ICamera):
+    def __init__(self, n_frames=None, delay=0.0):
+        self.n_frames = n_frames
+        self.delay = delay
+        self.count = 0
+        self.opened = 0
+        self.released = 0
+
+    def open(self):
+        self.opened += 1
+
+    def read(self):
+        if self.n_frames is not None and self.count >= self.n_frames:
+            raise RuntimeError("cámara desconectada")
+        time.sleep(self.delay)
+        self.count += 1
+        return np.full((2, 2, 3), self.count, dtype=np.int32)
+
+    def release(self):
+        self.released += 1
+
+
+def test_read_returns_latest_frames():
+    camera = ThreadedCamera(FakeCamera(n_frames=50, delay=0.002), read_timeout=1.0)
+    camera.open()
+
+    seen = []
+    with pytest.raises(RuntimeError, match="desconectada"):
+        while True:
+            seen.append(int(camera.read()[0, 0, 0]))
+
+    assert seen
+    assert seen == sorted(set(seen))
+    camera.release()
+
+
+def test_open_twice_starts_one_thread():
+    fake = FakeCamera()
+    camera = ThreadedCamera(fake)
+    camera.open()
+    threads = threading.active_count()
+
+    camera.open()
+    assert fake.opened == 1
+    assert threading.active_count() == threads
+    assert camera.read() is not None
+    camera.release()
+
+
+def test_release_stops_thread():
+    fake = FakeCamera()
+    camera = ThreadedCamera(fake)
+    camera.open()
+    camera.read()
+    thread = camera._thread
+
+    camera.release()
+    assert not thread.is_alive()
+    assert fake.released == 1
+
+    with pytest.raises(RuntimeError):
+        camera.read()
+
+
+class BlockingCamera(FakeCamera):
+    """Cámara cuyo read() se queda bloqueado hasta que el test lo suelta."""
+
+    def __init__(self):
+        super().__init__()
+        self.in_read = threading.Event()
+        self.unblock = threading.Event()
+        self.reading = False
+        self.released_while_reading = False
+
+    def read(self):
+        if self.count > 0:
+            self.reading = True
+            self.in_read.set()
+            self.unblock.wait(timeout=5)
+            self.reading = False
+        return super().read()
+
+    def release(self):
+        self.released_while_reading = self.reading
+        super().release()
+
+
+def test_release_waits_for_blocked_read():
+    fake = BlockingCamera()
+    camera = ThreadedCamera(fake, read_timeout=0.05)
+    camera.open()
+    camera.read()
+    assert fake.in_read.wait(timeout=5)
+    thread = camera._thread
+
+    camera.release()
+    assert fake.released == 0
+
+    fake.unblock.set()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert fake.released == 1
+    assert not fake.released_while_reading
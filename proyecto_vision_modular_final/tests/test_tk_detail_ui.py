@@ -0,0 +1,211 @@
+'''
+Test de TkDetailUI sin pantalla: widgets y root falsos, con un executor real de un hilo.
+    1.-FakeWidget reemplaza a los widgets de Tk/ttk y guarda el texto que se les configura.
+    2.-FakeRoot guarda los callbacks de after(); run_after los ejecuta a mano y destroy() hace
+      que after() falle como con Tk ya destruido.
+    3.-SlowRepo es un inventario en memoria cuyo adjust_qty puede quedar frenado hasta que el
+      test lo suelte, para simular una escritura en curso.
+    4.-Los tests validan el debounce de +1/-1, la corrección con el valor real (sumando clics
+      pendientes), que se descarten resultados viejos o de otro componente y que flush()
+      funcione después de destruir root.
+'''
+
+import threading
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config.assets import DefaultAssetRegistry
+from ui import tk_detail_ui
+from ui.tk_detail_ui import TkDetailUI
+
+
+class FakeWidget:
+    def __init__(self, *args, **kwargs):
+        self.text = kwargs.get("text")
+        self.value = ""
+
+    def config(self, **kwargs):
+        if "text" in kwargs:
+            self.text = kwargs["text"]
+
+    def get(self):
+        return self.value
+
+    def delete(self, *args):
+        self.value = ""
+
+    def __getattr__(self, name):
+        # pack, grid, bind, title, withdraw, deiconify, lift, protocol...
+        return lambda *args, **kwargs: None
+
+
+class FakeRoot:
+    def __init__(self):
+        self.pending = {}
+        self.next_id = 0
+        self.destroyed = False
+
+    def after(self, ms, fn, *args):
+        if self.destroyed:
+            raise tk.TclError('can\'t invoke "after" command: application has been destroyed')
+        self.next_id += 1
+        after_id = f"after#{self.next_id}"
+        self.pending[after_id] = (fn, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        if self.destroyed:
+            raise tk.TclError("application has been destroyed")
+        self.pending.pop(after_id, None)
+
+    def register(self, fn):
+        return "validate"
+
+    def destroy(self):
+        self.destroyed = True
+        self.pending.clear()
+
+    def run_after(self, name):
+        """Ejecuta los callbacks pendientes cuyo nombre es name (p. ej. '_drain_io')."""
+        for after_id, (fn, args) in list(self.pending.items()):
+            if fn.__name__ == name:
+                del self.pending[after_id]
+                fn(*args)
+
+
+class SlowRepo:
+    def __init__(self, quantities):
+        self.quantities = dict(quantities)
+        self.adjust_calls = []
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def read_qty(self, name):
+        return self.quantities.get(name, 0)
+
+    def write_qty(self, name, qty):
+        self.quantities[name] = max(0, qty)
+
+    def adjust_qty(self, name, delta):
+        self.gate.wait(timeout=5)
+        self.adjust_calls.append((name, delta))
+        self.quantities[name] = max(0, self.quantities.get(name, 0) + delta)
+        return self.quantities[name]
+
+
+@pytest.fixture
+def make_ui(monkeypatch, tmp_path):
+    for name in ("Label", "Frame", "Button", "Entry"):
+        monkeypatch.setattr(tk_detail_ui.ttk, name, FakeWidget)
+    monkeypatch.setattr(tk_detail_ui.tk, "Toplevel", FakeWidget)
+    pools = []
+
+    def factory(quantities):
+        root, repo = FakeRoot(), SlowRepo(quantities)
+        pool = ThreadPoolExecutor(max_workers=1)
+        pools.append(pool)
+        ui = TkDetailUI(root, repo, DefaultAssetRegistry(str(tmp_path)), io_pool=pool)
+        return ui, root, repo, pool
+
+    yield factory
+    for pool in pools:
+        pool.shutdown(wait=True)
+
+
+def settle(ui, root):
+    """Hace girar el poll de io_pool hasta aplicar todas las operaciones en curso."""
+    deadline = time.monotonic() + 5
+    while ui._io_inflight and time.monotonic() < deadline:
+        root.run_after("_drain_io")
+        time.sleep(0.005)
+    assert ui._io_inflight == 0
+
+
+def qty_text(ui):
+    return ui._lbl_qty.text
+
+
+def test_burst_of_clicks_is_one_adjust(make_ui):
+    ui, root, repo, _ = make_ui({"7805": 5})
+    ui.show_component("7805")
+    settle(ui, root)
+    assert qty_text(ui) == "Cantidad en inventario: 5"
+
+    for _ in range(5):
+        ui._increase_qty()
+    for _ in range(2):
+        ui._decrease_qty()
+    assert qty_text(ui) == "Cantidad en inventario: 8"
+    assert repo.adjust_calls == []
+
+    root.run_after("_flush_delta")
+    settle(ui, root)
+    assert repo.adjust_calls == [("7805", 3)]
+    assert qty_text(ui) == "Cantidad en inventario: 8"
+
+
+def test_pending_clicks_are_added_to_result(make_ui):
+    ui, root, repo, _ = make_ui({"7805": 5})
+    ui.show_component("7805")
+    settle(ui, root)
+
+    repo.gate.clear()
+    ui._increase_qty()
+    root.run_after("_flush_delta")
+    # Dos clics más mientras el adjust_qty(+1) sigue en curso
+    ui._increase_qty()
+    ui._increase_qty()
+
+    repo.gate.set()
+    settle(ui, root)
+    assert repo.adjust_calls == [("7805", 1)]
+    assert qty_text(ui) == "Cantidad en inventario: 8"
+
+
+def test_result_for_hidden_component_is_dropped(make_ui):
+    ui, root, repo, _ = make_ui({"7805": 5, "7404": 1})
+    ui.show_component("7805")
+    settle(ui, root)
+
+    repo.gate.clear()
+    ui._increase_qty()
+    ui.show_component("7404")  # envía el +1 pendiente de 7805 y lee 7404
+    repo.gate.set()
+    settle(ui, root)
+
+    assert repo.adjust_calls == [("7805", 1)]
+    assert qty_text(ui) == "Cantidad en inventario: 1"
+
+
+def test_manual_apply_wins_over_inflight_adjust(make_ui):
+    ui, root, repo, _ = make_ui({"7805": 5})
+    ui.show_component("7805")
+    settle(ui, root)
+
+    repo.gate.clear()
+    ui._increase_qty()
+    root.run_after("_flush_delta")
+    ui._entry_qty.value = "10"
+    ui._apply_manual_qty()
+    assert qty_text(ui) == "Cantidad en inventario: 10"
+
+    repo.gate.set()
+    settle(ui, root)
+    assert repo.quantities["7805"] == 10
+    assert qty_text(ui) == "Cantidad en inventario: 10"
+
+
+def test_flush_after_root_destroyed(make_ui):
+    ui, root, repo, pool = make_ui({"7805": 5})
+    ui.show_component("7805")
+    settle(ui, root)
+
+    ui._increase_qty()
+    root.destroy()
+    ui.flush()
+    pool.shutdown(wait=True)
+    assert repo.adjust_calls == [("7805", 1)]
+    assert repo.quantities["7805"] == 6
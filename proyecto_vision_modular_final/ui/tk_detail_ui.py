@@ -4,20 +4,40 @@ detectado: imagen, nombre, cantidad en inventario y acceso al datasheet.
 
 - Recibe un IInventoryRepo inyectado (repo) para leer/escribir cantidades.
 - Recibe un BaseAssetRegistry inyectado (asset_registry) para obtener imágenes y mapeos.
+- Opcionalmente recibe un Executor (io_pool) para leer y escribir en el inventario fuera del
+  hilo de Tk: la cantidad se muestra al instante y se corrige cuando el repositorio responde.
+  Lecturas y escrituras van al mismo pool para no usar el repositorio desde dos hilos a la vez.
 
 IMPORTANTE:
 AppController llama: ui.show(label, conf, resume_callback)
 Por eso show() aquí acepta (class_name, conf, on_retake).
 """
 
+import os
+import queue
+import threading
 import tkinter as tk
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
 from tkinter import ttk
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, Iterable, Tuple
 
 from PIL import Image, ImageTk  # requiere pillow
 
 from interfaces import IDetailUI, IInventoryRepo
-from config.assets import BaseAssetRegistry
+from config.assets import BaseAssetRegistry, THUMB_SIZE
+
+# Máximo de imágenes ya redimensionadas que se guardan en memoria
+PHOTO_CACHE_SIZE = 32
+
+# Cada cuántos ms el hilo de Tk revisa las imágenes precargadas en segundo plano
+PREWARM_POLL_MS = 20
+
+# Cada cuántos ms el hilo de Tk revisa las operaciones de inventario terminadas en io_pool
+IO_POLL_MS = 20
+
+# Espera (ms) tras el último clic de +1/-1 antes de enviar el cambio acumulado al inventario
+QTY_DEBOUNCE_MS = 250
 
 
 class TkDetailUI(IDetailUI):
@@ -26,10 +46,13 @@ class TkDetailUI(IDetailUI):
         root: tk.Tk,
         repo: IInventoryRepo,
         asset_registry: BaseAssetRegistry,
+        io_pool: Optional[Executor] = None,
     ) -> None:
         self._root = root
         self._repo = repo
         self._assets = asset_registry  # inyectado, nada global
+        # Si es None, las escrituras se hacen en el hilo de Tk (comportamiento original)
+        self._io_pool = io_pool
 
         # callback para "volver a lectura" (lo manda el controller)
         self._on_retake: Optional[Callable[[], None]] = None
@@ -84,7 +107,11 @@ class TkDetailUI(IDetailUI):
         frame_manual.pack(pady=5)
 
         ttk.Label(frame_manual, text="Cantidad manual:").grid(row=0, column=0, padx=5)
-        self._entry_qty = ttk.Entry(frame_manual, width=10)
+        # Tk descarta las teclas que no formen un entero, así no llegan a _apply_manual_qty
+        validate_qty = (self._root.register(self._is_partial_qty), "%P")
+        self._entry_qty = ttk.Entry(
+            frame_manual, width=10, validate="key", validatecommand=validate_qty
+        )
         self._entry_qty.grid(row=0, column=1, padx=5)
 
         self._btn_apply_manual = ttk.Button(
@@ -109,8 +136,29 @@ class TkDetailUI(IDetailUI):
 
         # Estado interno
         self._current_photo: Optional[ImageTk.PhotoImage] = None
+        # Caché ruta original -> PhotoImage lista para mostrar (LRU, máx. PHOTO_CACHE_SIZE).
+        # La clave es siempre la imagen original, aunque se haya leído de la miniatura
+        self._photo_cache: "OrderedDict[str, ImageTk.PhotoImage]" = OrderedDict()
         self._current_url: Optional[str] = None
         self._current_component_name: Optional[str] = None
+        # Nombre en el inventario del componente mostrado (se resuelve una vez por show_component)
+        self._current_excel_name: Optional[str] = None
+        # Última cantidad mostrada (base para la actualización optimista de +1/-1);
+        # None mientras se lee la cantidad del componente recién mostrado
+        self._current_qty: Optional[int] = 0
+        # Clics de +1/-1 acumulados que aún no se enviaron al repositorio
+        self._pending_delta = 0
+        self._pending_excel_name: Optional[str] = None
+        self._flush_after_id: Optional[str] = None
+        # Operaciones de io_pool terminadas, pendientes de aplicar en el hilo de Tk.
+        # El hilo del pool solo encola: Tk no se puede llamar desde otro hilo
+        self._io_done: "queue.Queue[Tuple[str, int, Future, bool]]" = queue.Queue()
+        self._io_inflight = 0
+        self._io_polling = False
+        # Número de orden de cada operación y el de la última enviada por componente: el
+        # resultado de una operación vieja no pisa lo que mostró una más nueva
+        self._io_seq = 0
+        self._latest_io_seq: Dict[str, int] = {}
 
     # ------------------------------------------------------------------
     # Implementación del contrato IDetailUI
@@ -137,6 +185,7 @@ class TkDetailUI(IDetailUI):
     # ------------------------------------------------------------------
 
     def show_component(self, class_name: str) -> None:
+        self._flush_delta()
         self._lbl_error.config(text="")
         self._entry_qty.delete(0, tk.END)
 
@@ -144,15 +193,16 @@ class TkDetailUI(IDetailUI):
         self._lbl_name.config(text=f"Componente: {class_name}")
 
         excel_name = self._assets.map_to_excel_name(class_name) or class_name
+        self._current_excel_name = excel_name
 
-        try:
-            qty = self._repo.read_qty(excel_name)
-        except Exception:
-            qty = 0
-        self._lbl_qty.config(text=f"Cantidad en inventario: {qty}")
+        self._current_qty = None
+        self._lbl_qty.config(text="Cantidad en inventario: …")
+        self._run_inventory_io(
+            excel_name, None, self._read_qty_or_zero, excel_name, resync=False
+        )
 
         img_path = self._assets.get_image_path(class_name)
-        self._update_image(img_path)
+        self._update_image(img_path, self._assets.get_thumbnail_path(class_name))
 
         url = self._assets.get_datasheet_url(class_name)
         self._current_url = url
@@ -164,75 +214,108 @@ class TkDetailUI(IDetailUI):
         self._window.deiconify()
         self._window.lift()
 
+    def prewarm(self, class_names: Iterable[str]) -> None:
+        """
+        Precarga las imágenes de las clases indicadas para que el primer
+        show_component no tenga que leer ni redimensionar desde disco.
+
+        La lectura/redimensionado (PIL) se hace en un hilo en segundo plano; los
+        PhotoImage se crean en el hilo de Tk, que es el único que puede hacerlo.
+        """
+        paths: Dict[str, Optional[str]] = {}
+        for name in class_names:
+            path = self._assets.get_image_path(name)
+            if path and path not in self._photo_cache and path not in paths:
+                paths[path] = self._assets.get_thumbnail_path(name)
+        if not paths:
+            return
+
+        loaded: "queue.Queue[Tuple[str, Image.Image]]" = queue.Queue()
+        worker = threading.Thread(
+            target=self._prewarm_worker,
+            args=(list(paths.items()), loaded),
+            name="tk-detail-prewarm",
+            daemon=True,
+        )
+        worker.start()
+        self._root.after(PREWARM_POLL_MS, self._drain_prewarm, loaded, worker)
+
+    def flush(self) -> None:
+        """Envía ya al inventario los clics de +1/-1 que estén esperando."""
+        self._flush_delta()
+
     def update_inventory_display(self) -> None:
-        if not self._current_component_name:
+        excel_name = self._current_excel_name
+        if not excel_name:
             return
 
-        excel_name = (
-            self._assets.map_to_excel_name(self._current_component_name)
-            or self._current_component_name
+        self._run_inventory_io(
+            excel_name, None, self._read_qty_or_zero, excel_name, resync=False
         )
-        try:
-            qty = self._repo.read_qty(excel_name)
-        except Exception:
-            qty = 0
-        self._lbl_qty.config(text=f"Cantidad en inventario: {qty}")
 
     # ------------------------------------------------------------------
     # Lógica de botones
     # ------------------------------------------------------------------
 
     def _increase_qty(self) -> None:
-        if not self._current_component_name:
-            return
-
-        excel_name = (
-            self._assets.map_to_excel_name(self._current_component_name)
-            or self._current_component_name
-        )
-        current = self._repo.read_qty(excel_name)
-        self._repo.write_qty(excel_name, current + 1)
-        self.update_inventory_display()
+        self._bump_qty(+1)
 
     def _decrease_qty(self) -> None:
-        if not self._current_component_name:
+        self._bump_qty(-1)
+
+    def _bump_qty(self, delta: int) -> None:
+        """
+        Acumula el clic y lo muestra al instante; el cambio se envía en una sola
+        llamada a adjust_qty cuando pasan QTY_DEBOUNCE_MS sin nuevos clics.
+        """
+        excel_name = self._current_excel_name
+        if not excel_name or self._current_qty is None:
+            # Todavía no se sabe la cantidad de partida
             return
 
-        excel_name = (
-            self._assets.map_to_excel_name(self._current_component_name)
-            or self._current_component_name
-        )
-        current = self._repo.read_qty(excel_name)
-        new = max(0, current - 1)
-        self._repo.write_qty(excel_name, new)
-        self.update_inventory_display()
+        new = max(0, self._current_qty + delta)
+        # Se acumula el cambio efectivo (bajar de 0 no cuenta)
+        self._pending_delta += new - self._current_qty
+        self._pending_excel_name = excel_name
+        self._show_qty(new)
+
+        self._cancel_pending_flush()
+        self._flush_after_id = self._root.after(QTY_DEBOUNCE_MS, self._flush_delta)
+
+    @staticmethod
+    def _is_int_text(text: str) -> bool:
+        """True si text es un entero en base 10 con un '-' opcional (sin lanzar excepciones)."""
+        digits = text[1:] if text.startswith("-") else text
+        # isdecimal y no isdigit: int() rechaza dígitos como '²' que isdigit acepta
+        return digits.isdecimal()
+
+    @classmethod
+    def _is_partial_qty(cls, proposed: str) -> bool:
+        """validatecommand del Entry: acepta vacío o '-' mientras se escribe, o un entero."""
+        return proposed in ("", "-") or cls._is_int_text(proposed)
 
     def _apply_manual_qty(self) -> None:
         self._lbl_error.config(text="")
-        if not self._current_component_name:
+        excel_name = self._current_excel_name
+        if not excel_name:
             return
 
         text = self._entry_qty.get().strip()
         if not text:
             return
 
-        try:
-            qty = int(text)
-        except ValueError:
+        if not self._is_int_text(text):
             msg = f"Entrada inválida '{text}': ingresa solo números enteros."
             print("[TkDetailUI]", msg)
             self._lbl_error.config(text=msg)
             return
 
+        qty = int(text)
         if qty < 0:
             qty = 0
 
-        excel_name = (
-            self._assets.map_to_excel_name(self._current_component_name)
-            or self._current_component_name
-        )
-        self._repo.write_qty(excel_name, qty)
-        self.update_inventory_display()
+        self._flush_delta()
+        self._run_inventory_io(excel_name, qty, self._repo.write_qty, excel_name, qty)
 
     def _retake_reading(self) -> None:
         """
@@ -248,27 +331,223 @@ class TkDetailUI(IDetailUI):
                 print(f"[TkDetailUI] Error al ejecutar callback de retake: {e}")
 
         # 2) ocultar UI
+        self._flush_delta()
+        self._current_excel_name = None
         self._window.withdraw()
 
     # ------------------------------------------------------------------
     # Métodos internos de soporte
     # ------------------------------------------------------------------
 
-    def _update_image(self, img_path: Optional[str]) -> None:
+    def _read_qty_or_zero(self, excel_name: str) -> int:
+        """Lectura para mostrar: si el repositorio falla se muestra 0, como antes."""
+        try:
+            return self._repo.read_qty(excel_name)
+        except Exception:
+            return 0
+
+    def _show_qty(self, qty: int) -> None:
+        self._current_qty = qty
+        self._lbl_qty.config(text=f"Cantidad en inventario: {qty}")
+
+    def _cancel_pending_flush(self) -> None:
+        if self._flush_after_id is None:
+            return
+        try:
+            self._root.after_cancel(self._flush_after_id)
+        except tk.TclError:
+            # La ventana ya se destruyó (cierre de la app)
+            pass
+        self._flush_after_id = None
+
+    def _flush_delta(self) -> None:
+        """Envía el cambio acumulado de +1/-1 como una sola llamada a adjust_qty."""
+        self._cancel_pending_flush()
+        delta, excel_name = self._pending_delta, self._pending_excel_name
+        self._pending_delta, self._pending_excel_name = 0, None
+        if not excel_name or delta == 0:
+            return
+        self._run_inventory_io(excel_name, None, self._repo.adjust_qty, excel_name, delta)
+
+    def _run_inventory_io(
+        self,
+        excel_name: str,
+        optimistic: Optional[int],
+        fn: Callable[..., Any],
+        *args: Any,
+        resync: bool = True,
+    ) -> None:
+        """
+        Ejecuta una operación del repositorio mostrando antes la cantidad esperada.
+
+        Con io_pool la operación corre en otro hilo; al terminar queda en _io_done y
+        _drain_io (en el hilo de Tk) llama a _reconcile_qty, que muestra el valor real o
+        el error. Sin io_pool se ejecuta aquí mismo.
+        Si falla y resync es True, se vuelve a leer la cantidad para no dejar el valor optimista.
+        """
+        if optimistic is not None:
+            self._show_qty(optimistic)
+
+        self._io_seq += 1
+        seq = self._io_seq
+        self._latest_io_seq[excel_name] = seq
+
+        if self._io_pool is None:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            self._reconcile_qty(excel_name, future, resync, seq)
+            return
+
+        future = self._io_pool.submit(fn, *args)
+        self._io_inflight += 1
+        future.add_done_callback(lambda f: self._io_done.put((excel_name, seq, f, resync)))
+        if not self._io_polling:
+            try:
+                self._root.after(IO_POLL_MS, self._drain_io)
+            except tk.TclError:
+                # root ya se destruyó (cierre de la app): nadie mostrará el resultado, pero
+                # la operación sigue en io_pool y shutdown(wait=True) espera a que termine
+                return
+            self._io_polling = True
+
+    def _drain_io(self) -> None:
+        """Hilo de Tk: aplica las operaciones de inventario que ya terminaron."""
+        while True:
+            try:
+                excel_name, seq, future, resync = self._io_done.get_nowait()
+            except queue.Empty:
+                break
+            self._io_inflight -= 1
+            self._reconcile_qty(excel_name, future, resync, seq)
+
+        if self._io_inflight > 0:
+            self._root.after(IO_POLL_MS, self._drain_io)
+        else:
+            self._io_polling = False
+
+    def _reconcile_qty(
+        self, excel_name: str, future: Future, resync: bool = False, seq: Optional[int] = None
+    ) -> None:
+        """
+        Hilo de Tk: aplica el resultado de una operación de inventario ya terminada.
+        Si después se envió otra operación para el mismo componente, el valor se descarta:
+        io_pool las ejecuta en orden, así que la más nueva es la que manda.
+        """
+        try:
+            result = future.result()
+        except Exception as e:
+            msg = f"No se pudo actualizar el inventario: {e}"
+            print("[TkDetailUI]", msg)
+            if excel_name == self._current_excel_name:
+                self._lbl_error.config(text=msg)
+                if resync:
+                    self._run_inventory_io(
+                        excel_name, None, self._repo.read_qty, excel_name, resync=False
+                    )
+            return
+
+        if seq is not None and seq < self._latest_io_seq.get(excel_name, 0):
+            return
+
+        # Solo se corrige la etiqueta si el componente sigue en pantalla, sumando
+        # los clics que todavía no se enviaron
+        if isinstance(result, int) and excel_name == self._current_excel_name:
+            pending = self._pending_delta if self._pending_excel_name == excel_name else 0
+            self._show_qty(max(0, result + pending))
+
+    def _update_image(self, img_path: Optional[str], thumb_path: Optional[str] = None) -> None:
         if not img_path:
             self._img_label.config(image="", text="(Sin imagen)")
             self._current_photo = None
             return
 
+        photo = self._photo_cache.get(img_path)
+        if photo is None:
+            try:
+                photo = ImageTk.PhotoImage(self._load_pil_image(img_path, thumb_path))
+            except Exception:
+                self._img_label.config(image="", text="(Error al cargar imagen)")
+                self._current_photo = None
+                return
+            self._cache_photo(img_path, photo)
+        else:
+            self._photo_cache.move_to_end(img_path)
+
+        self._img_label.config(image=photo, text="")
+        self._current_photo = photo
+
+    def _cache_photo(self, img_path: str, photo: ImageTk.PhotoImage) -> None:
+        """Guarda la imagen en la caché, descartando la menos usada si está llena."""
+        self._photo_cache[img_path] = photo
+        self._photo_cache.move_to_end(img_path)
+        while len(self._photo_cache) > PHOTO_CACHE_SIZE:
+            self._photo_cache.popitem(last=False)
+
+    @staticmethod
+    def _load_pil_image(img_path: str, thumb_path: Optional[str] = None) -> Image.Image:
+        """
+        Lee la imagen desde disco y la deja lista para mostrar (máx. THUMB_SIZE de lado,
+        sin deformarla). Si thumb_path existe y no es más vieja que la original se lee esa
+        miniatura; si no, se reduce la original y, si hubo que reducirla, se guarda en
+        thumb_path para la próxima vez.
+        """
+        if thumb_path and TkDetailUI._thumbnail_is_fresh(img_path, thumb_path):
+            with Image.open(thumb_path) as src:
+                src.thumbnail((THUMB_SIZE, THUMB_SIZE), Image.Resampling.LANCZOS)
+                return src.copy()
+
+        with Image.open(img_path) as src:
+            original_size = src.size
+            src.thumbnail((THUMB_SIZE, THUMB_SIZE), Image.Resampling.LANCZOS)
+            img = src.copy()
+
+        if thumb_path and img.size != original_size:
+            try:
+                os.makedirs(os.path.dirname(thumb_path), exist_ok=True)
+                img.save(thumb_path, format="PNG")
+            except Exception as e:
+                print(f"[WARN] No se pudo guardar la miniatura {thumb_path}: {e}")
+        return img
+
+    @staticmethod
+    def _thumbnail_is_fresh(img_path: str, thumb_path: str) -> bool:
+        """True si la miniatura existe y es al menos tan nueva como la imagen original."""
         try:
-            img = Image.open(img_path)
-            img = img.resize((200, 200))
-            photo = ImageTk.PhotoImage(img)
-            self._img_label.config(image=photo, text="")
-            self._current_photo = photo
-        except Exception:
-            self._img_label.config(image="", text="(Error al cargar imagen)")
-            self._current_photo = None
+            return os.path.getmtime(thumb_path) >= os.path.getmtime(img_path)
+        except OSError:
+            # Falta la miniatura (o la original): se lee/genera desde la original
+            return False
+
+    @classmethod
+    def _prewarm_worker(
+        cls,
+        paths: Iterable[Tuple[str, Optional[str]]],
+        loaded: "queue.Queue[Tuple[str, Image.Image]]",
+    ) -> None:
+        """Hilo en segundo plano: decodifica las imágenes y las deja en la cola."""
+        for path, thumb_path in paths:
+            try:
+                loaded.put((path, cls._load_pil_image(path, thumb_path)))
+            except Exception as e:
+                print(f"[TkDetailUI] No se pudo precargar la imagen {path}: {e}")
+
+    def _drain_prewarm(
+        self, loaded: "queue.Queue[Tuple[str, Image.Image]]", worker: threading.Thread
+    ) -> None:
+        """Hilo de Tk: convierte lo precargado en PhotoImage y lo guarda en la caché."""
+        while True:
+            try:
+                path, img = loaded.get_nowait()
+            except queue.Empty:
+                break
+            if path not in self._photo_cache:
+                self._cache_photo(path, ImageTk.PhotoImage(img))
+
+        if worker.is_alive() or not loaded.empty():
+            self._root.after(PREWARM_POLL_MS, self._drain_prewarm, loaded, worker)
 
     def _open_datasheet_in_browser(self, event=None) -> None:
         if not self._current_url:
@@ -283,4 +562,6 @@ class TkDetailUI(IDetailUI):
                 self._on_retake()
             except Exception:
                 pass
+        self._flush_delta()
+        self._current_excel_name = None
         self._window.withdraw()